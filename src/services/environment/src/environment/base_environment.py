@@ -32,7 +32,7 @@ class BaseEnvironment:
         """
         self.environment_name = environment_name
         self.llm_base_url = os.getenv("LLM_SERVICE_URL", "http://llm-interface:8000")
-        self.challenge_id = str(uuid.uuid4())
+        self.challenge_id = uuid.uuid4().hex
 
         # create the output directory for the environment
         self.output_dir = os.path.join(
@@ -40,7 +40,7 @@ class InterfaceClient:
             logger.info(f"Session already initialized: {self.session_id}")
             return self.session_id
 
-        self.session_id = str(uuid.uuid4())
+        self.session_id = uuid.uuid4().hex
         self._initialized = True
 
         logger.info(f"Session initialized: {self.session_id}")
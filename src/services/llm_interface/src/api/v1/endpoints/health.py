@@ -1,9 +1,13 @@
-from fastapi import APIRouter, status
+import orjson
+from fastapi import APIRouter, Response, status
 
 from ....models.responses import HealthResponse
 
 router = APIRouter(tags=["Health"])
 
+# the health payload never changes, so serialize it once at import time
+HEALTH_BODY: bytes = orjson.dumps(HealthResponse(status="healthy", service="llm_interface").model_dump())
+
 
 @router.get(
     "/health",
@@ -16,11 +20,11 @@ router = APIRouter(tags=["Health"])
         500: {"description": "Internal server error"},
     },
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Health check endpoint to verify the API is operational.
 
     Returns:
-        HealthResponse with service status
+        Pre-encoded HealthResponse body with service status
     """
-    return HealthResponse(status="healthy", service="llm_interface")
+    return Response(content=HEALTH_BODY, media_type="application/json")
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from ....core.dependencies import get_session_service
-from ....core.exceptions import SessionNotFoundException
+from ....core.exceptions import InvalidInputException, SessionNotFoundException
 from ....models.requests import InteractRequest
 from ....models.responses import InteractResponse
 
@@ -16,6 +16,7 @@ router = APIRouter(tags=["Interaction"])
     responses={
         200: {"description": "Interact with the LLM asynchronously"},
         404: {"description": "Session not found"},
+        422: {"description": "Input matches no interaction template of the role"},
         500: {"description": "Internal server error"},
     },
 )
@@ -42,3 +43,8 @@ async def interact(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
+    except InvalidInputException as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
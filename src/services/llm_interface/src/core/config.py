@@ -10,6 +10,10 @@ class Settings(BaseModel):
 
     REDIS_URL: str = Field("redis://redis:6379", env="REDIS_URL")
     AGENT_CONFIGS_PATH: str = Field("configs/agents", env="AGENT_CONFIGS_PATH")
+    SESSION_CACHE_TTL: float = Field(0.0, env="SESSION_CACHE_TTL")
+    SESSION_CACHE_MAXSIZE: int = Field(10_000, env="SESSION_CACHE_MAXSIZE")
+    MAX_CONCURRENT_LLM: int = Field(32, env="MAX_CONCURRENT_LLM")
+    LLM_LRU_SIZE: int = Field(256, env="LLM_LRU_SIZE")
 
     class Config:
         env_file = ".env"
@@ -16,7 +16,7 @@ def get_config_settings() -> Settings:
 def get_redis_client() -> aioredis.Redis:
     """Get Redis client instance."""
     settings: Settings = get_config_settings()
-    return aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return aioredis.from_url(settings.REDIS_URL, decode_responses=False)
 
 
 @lru_cache()
@@ -31,6 +31,12 @@ class TaskExecutionException(LLMInterfaceException):
     pass
 
 
+class InvalidInputException(LLMInterfaceException):
+    """Raised when interaction inputs match none of the role's interaction templates."""
+
+    pass
+
+
 def map_to_http_exception(exc: LLMInterfaceException) -> HTTPException:
     """Map custom exceptions to FastAPI HTTPExceptions."""
     mapping = {
@@ -50,6 +56,10 @@ def map_to_http_exception(exc: LLMInterfaceException) -> HTTPException:
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             "Task execution failed",
         ),
+        InvalidInputException: (
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            "Invalid interaction input",
+        ),
     }
     status_code, detail = mapping.get(
         type(exc),
@@ -10,16 +10,17 @@ from .utils import load_agent_config, make_agent_signature
 class LLMInterface(dspy.Module):
     def __init__(
         self,
-        config_file_path: str,
+        agent_configs: Dict[str, Any],
         past_messages: List[Dict[str, Any]] | None = None,
     ) -> None:
         """
         Initialize the LLMInterface.
 
         Args:
-            config_file_path: The path to the agent configuration file.
+            agent_configs: The parsed agent configuration. It is only read, so it can be shared.
+            past_messages: The conversation history to resume from.
         """
-        _agent_configs: Dict[str, Any] = load_agent_config(config_file_path)
+        _agent_configs: Dict[str, Any] = agent_configs
 
         # set the agent's role, signatures, and interaction templates
         self.role: str = _agent_configs["role"]
@@ -28,6 +29,10 @@ class LLMInterface(dspy.Module):
             template_name: [input_var["name"] for input_var in template_configs["inputs"]]
             for template_name, template_configs in _agent_configs["interaction_templates"].items()
         }
+        # dispatch table from a template's input names to the template, so interact resolves it in one lookup
+        self._template_dispatch: Dict[frozenset[str], str] = {}
+        for template_name, template_inputs in self.interaction_templates.items():
+            self._template_dispatch.setdefault(frozenset(template_inputs), template_name)
 
         self.model_name: str = f"{_agent_configs['model_provider']}/{_agent_configs['model_name']}"
         self.model_params: Dict[str, Any] = _agent_configs["model_params"]
@@ -45,6 +50,24 @@ class LLMInterface(dspy.Module):
             cache=False,
         )
 
+    @classmethod
+    def from_config_file(
+        cls,
+        config_file_path: str,
+        past_messages: List[Dict[str, Any]] | None = None,
+    ) -> "LLMInterface":
+        """
+        Build an LLMInterface from an agent configuration file.
+
+        Args:
+            config_file_path: The path to the agent configuration file.
+            past_messages: The conversation history to resume from.
+
+        Returns:
+            The LLMInterface object.
+        """
+        return cls(load_agent_config(config_file_path), past_messages=past_messages)
+
     @staticmethod
     def get_api_key(model_provider: str) -> str:
         """
@@ -80,18 +103,17 @@ class LLMInterface(dspy.Module):
         # check if the input variables match any of the interaction templates
         input_variables = kwargs.keys()
 
-        for template_name, template_inputs in self.interaction_templates.items():
-            if set(input_variables) == set(template_inputs):
-                signature: dspy.Predict = self.signatures[template_name]
-                break
-        else:
+        template_name = self._template_dispatch.get(frozenset(input_variables))
+        if template_name is None:
             raise ValueError(f"No matching interaction template found for input variables: {input_variables}")
+        signature: dspy.Predict = self.signatures[template_name]
 
         # acutally send the damn thing
         try:
             output = await signature.acall(
                 lm=self.lm,
-                history=dspy.History(messages=self.past_messages),
+                # the history is produced by this class, skip re-validating every past message per turn
+                history=dspy.History.model_construct(messages=self.past_messages),
                 **kwargs,
             )
             self.past_messages.append({**kwargs, **output})
@@ -1,13 +1,71 @@
-import asyncio
-import json
+from functools import lru_cache
 from typing import Any, Dict, List
 
+import orjson
 import redis.asyncio as aioredis
+from cachetools import TTLCache
 from loguru import logger
 
 from ..core.config import get_settings
 from ..models.domain import RoleHistory, Session
 
+# outcomes reported by _CREATE_SESSION_LUA
+_CREATED_SESSION = 0
+_ADDED_ROLE = 1
+_ROLE_EXISTS = 2
+
+# atomically create a session or add a role to it in a single round trip.
+# KEYS: session key, role history list key. ARGV: role, new session record.
+_CREATE_SESSION_LUA = """
+local session = redis.call('GET', KEYS[1])
+if not session then
+    redis.call('SET', KEYS[1], ARGV[2])
+    redis.call('DEL', KEYS[2])
+    return 0
+end
+local data = cjson.decode(session)
+for _, existing_role in ipairs(data['roles']) do
+    if existing_role == ARGV[1] then
+        return 2
+    end
+end
+table.insert(data['roles'], ARGV[1])
+redis.call('SET', KEYS[1], cjson.encode(data))
+redis.call('DEL', KEYS[2])
+return 1
+"""
+
+# atomically delete a session record and its role history lists, returning the roles (nil if missing).
+# KEYS: session key. role keys are derived from it, matching _role_key.
+_DELETE_SESSION_LUA = """
+local session = redis.call('GET', KEYS[1])
+if not session then
+    return false
+end
+local roles = cjson.decode(session)['roles']
+redis.call('DEL', KEYS[1])
+for _, role in ipairs(roles) do
+    redis.call('DEL', KEYS[1] .. ':' .. role)
+end
+return roles
+"""
+
+
+@lru_cache(maxsize=8192)
+def _session_key(session_id: str) -> str:
+    """
+    Build the Redis key of a session record.
+    """
+    return f"session:{session_id}"
+
+
+@lru_cache(maxsize=8192)
+def _role_key(session_id: str, role: str) -> str:
+    """
+    Build the Redis key of a role's history list within a session.
+    """
+    return f"session:{session_id}:{role}"
+
 
 class SessionRepository:
     """
@@ -16,10 +74,32 @@ class SessionRepository:
 
     def __init__(self) -> None:
         """
-        Initialize the repository with a Redis client.
+        Initialize the repository with a Redis client and the in-process history cache.
         """
         settings = get_settings()
-        self.redis: aioredis.Redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        # replies stay raw bytes: every stored value goes straight into a JSON parser, which takes bytes
+        self.redis: aioredis.Redis = aioredis.from_url(settings.REDIS_URL, decode_responses=False)
+        self._create_script = self.redis.register_script(_CREATE_SESSION_LUA)
+        self._delete_script = self.redis.register_script(_DELETE_SESSION_LUA)
+
+        # cache-aside for get_history. disabled unless a TTL is configured, since the cache is
+        # per-process and writes made by other workers only become visible once entries expire.
+        self._history_cache: TTLCache | None = None
+        if settings.SESSION_CACHE_TTL > 0:
+            self._history_cache = TTLCache(
+                maxsize=settings.SESSION_CACHE_MAXSIZE,
+                ttl=settings.SESSION_CACHE_TTL,
+            )
+
+    def _invalidate(self, session_id: str) -> None:
+        """
+        Drop the cached history of a session, if any.
+
+        Args:
+            session_id: Unique identifier for the session.
+        """
+        if self._history_cache is not None:
+            self._history_cache.pop(session_id, None)
 
     async def create(self, session_id: str, role: str) -> None:
         """
@@ -31,42 +111,37 @@ class SessionRepository:
             session_id: Unique identifier for the session.
             role: Role assigned to the session.
         """
-        if not await self.redis.exists(f"session:{session_id}"):
-            logger.info(f"Creating new session: {session_id}")
-            session = Session(session_id=session_id, roles=[role])
-            await self.redis.hset(
-                f"session:{session.session_id}",
-                mapping={"data": json.dumps(session.model_dump())},
-            )
-            await asyncio.gather(
-                *[
-                    self.redis.hset(
-                        f"session:{session.session_id}:{role}",
-                        mapping={"data": json.dumps(RoleHistory(role=role, history=[]).model_dump())},
-                    )
-                    for role in session.roles
-                ]
-            )
+        session = Session(session_id=session_id, roles=[role])
+        result = await self._create_script(
+            keys=[_session_key(session_id), _role_key(session_id, role)],
+            args=[role, orjson.dumps(session.model_dump())],
+        )
+
+        if result == _CREATED_SESSION:
+            logger.info(f"Created new session: {session_id}")
+        elif result == _ADDED_ROLE:
+            logger.info(f"Added new role: {role} to session: {session_id}")
         else:
-            logger.info(f"Session already exists: {session_id}")
-            # get session from redis and rebuild the session object
-            session_data = await self.redis.hgetall(f"session:{session_id}")
-            session = Session(**json.loads(session_data["data"]))
-
-            # add role to session if it doesn't exist o.w. do nothing
-            if role not in session.roles:
-                logger.info(f"Adding new role: {role} to session: {session_id}")
-                session.roles.append(role)
-                await self.redis.hset(
-                    f"session:{session_id}",
-                    mapping={"data": json.dumps(session.model_dump())},
-                )
-                await self.redis.hset(
-                    f"session:{session_id}:{role}",
-                    mapping={"data": json.dumps(RoleHistory(role=role, history=[]).model_dump())},
-                )
-            else:
-                logger.warning(f"Role already exists: {role} in session: {session_id}")
+            logger.warning(f"Role already exists: {role} in session: {session_id}")
+
+        self._invalidate(session_id)
+
+    async def get(self, session_id: str) -> Session | None:
+        """
+        Retrieve a session record without its role histories.
+
+        Args:
+            session_id: Unique identifier for the session.
+
+        Returns:
+            The session, or None if it does not exist.
+        """
+        session_data = await self.redis.get(_session_key(session_id))
+        if not session_data:
+            return None
+
+        logger.info(f"Session has data: {session_data.decode()}")
+        return Session.model_validate_json(session_data)
 
     async def get_history(self, session_id: str) -> Dict[str, RoleHistory]:
         """
@@ -78,16 +153,32 @@ class SessionRepository:
         Returns:
             A dictionary with session fields or empty dict if not found.
         """
+        if self._history_cache is not None and session_id in self._history_cache:
+            # hand out copies of the history lists, callers append to them in place
+            return {
+                role: role_history.model_copy(update={"history": list(role_history.history)})
+                for role, role_history in self._history_cache[session_id].items()
+            }
+
         session_history = {}
-        session_data = await self.redis.hgetall(f"session:{session_id}")
-
-        if session_data:
-            logger.info(f"Session has data: {session_data}")
-            session = Session(**json.loads(session_data["data"]))
-            for role in session.roles:
-                role_data = await self.redis.hgetall(f"session:{session_id}:{role}")
-                role_history = RoleHistory(**json.loads(role_data["data"]))
+        session = await self.get(session_id)
+
+        if session is not None and session.roles:
+            # fetch every role history in one round trip
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for role in session.roles:
+                    pipe.lrange(_role_key(session_id, role), 0, -1)
+                roles_entries = await pipe.execute()
+
+            for role, entries in zip(session.roles, roles_entries):
+                role_history = RoleHistory(role=role, history=[orjson.loads(entry) for entry in entries])
                 session_history.setdefault(role, role_history)
+
+        if self._history_cache is not None and session_history:
+            self._history_cache[session_id] = {
+                role: role_history.model_copy(update={"history": list(role_history.history)})
+                for role, role_history in session_history.items()
+            }
         return session_history
 
     async def get_all(self) -> Dict[str, Dict[str, Any]]:
@@ -95,56 +186,71 @@ class SessionRepository:
         Get all session-related data from Redis.
 
         Returns:
-            A dictionary where keys are Redis keys and values are the hash data for each key.
+            A dictionary where keys are Redis keys and values are the stored data for each key.
             Includes both main session keys (session:id) and role-specific keys (session:id:role).
         """
         all_session_data = {}
 
         # Find all session-related keys
         async for key in self.redis.scan_iter(match="session:*"):
-            # Get the hash data for each key
-            key_data = await self.redis.hgetall(key)
+            # role histories are lists of JSON entries, session records are plain JSON strings
+            if await self.redis.type(key) == b"list":
+                entries = await self.redis.lrange(key, 0, -1)
+                key = key.decode()
+                all_session_data[key] = {
+                    "role": key.split(":", 2)[2],
+                    "history": [orjson.loads(entry) for entry in entries],
+                }
+                continue
+
+            # Get the stored value for each key
+            key_data = await self.redis.get(key)
             if key_data:
-                # Parse JSON fields where applicable
-                for field, value in key_data.items():
-                    try:
-                        key_data[field] = json.loads(value)
-                    except (json.JSONDecodeError, TypeError):
-                        # Keep as string if not valid JSON
-                        pass
-                all_session_data[key] = key_data
+                # Parse JSON values where applicable
+                key = key.decode()
+                try:
+                    all_session_data[key] = orjson.loads(key_data)
+                except (orjson.JSONDecodeError, TypeError):
+                    # Keep as string if not valid JSON
+                    all_session_data[key] = key_data.decode()
 
         return all_session_data
 
-    async def save_past_messages(
+    async def append_history(
         self,
         session_id: str,
         role: str,
-        past_messages: List[Dict[str, Any]],
+        entries: List[Dict[str, Any]],
     ) -> None:
         """
-        Save past messages for a role in a session.
+        Append new messages to the history of a role in a session.
 
         Args:
             session_id: Unique identifier for the session.
-            role: Role of the agent to save past messages for.
-            past_messages: List of past messages to save.
-        """
-        logger.info(f"Saving past messages for {role} in session {session_id}")
-        role_history = RoleHistory(role=role, history=past_messages)
-        await self.redis.hset(
-            f"session:{session_id}:{role}",
-            mapping={"data": json.dumps(role_history.model_dump())},
-        )
+            role: Role of the agent to append messages for.
+            entries: New messages, in conversation order.
+        """
+        if not entries:
+            return
+
+        logger.info(f"Appending {len(entries)} messages for {role} in session {session_id}")
+        await self.redis.rpush(_role_key(session_id, role), *[orjson.dumps(entry) for entry in entries])
+        self._invalidate(session_id)
 
-    async def delete(self, session: Session) -> None:
+    async def delete_if_exists(self, session_id: str) -> List[str] | None:
         """
-        Delete a session and all its associated data.
+        Atomically delete a session and all its associated data.
 
         Args:
-            session: Session to delete.
+            session_id: Unique identifier for the session.
+
+        Returns:
+            The roles of the deleted session, or None if the session did not exist.
         """
-        await self.redis.delete(f"session:{session.session_id}")
-        await asyncio.gather(*[self.redis.delete(f"session:{session.session_id}:{role}") for role in session.roles])
+        roles = await self._delete_script(keys=[_session_key(session_id)])
+        self._invalidate(session_id)
+        if roles is None:
+            return None
 
-        logger.info(f"Deleted session: {session.session_id}")
+        logger.info(f"Deleted session: {session_id}")
+        return [role.decode() for role in roles]
@@ -1,15 +1,52 @@
+import asyncio
+import contextlib
 import os
-from typing import Any, Dict
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 from loguru import logger
 
 from ..core.config import Settings
-from ..core.exceptions import SessionNotFoundException
+from ..core.exceptions import InvalidInputException, SessionNotFoundException
 from ..llm.interface import LLMInterface
-from ..models.domain import Session
+from ..llm.utils import load_agent_config
 from ..repositories.session_repo import SessionRepository
 
 
+@lru_cache(maxsize=32)
+def _load_role_config(config_file: str) -> Dict[str, Any]:
+    """
+    Load and validate an agent configuration once per file.
+
+    Args:
+        config_file: Path to the role configuration file.
+
+    Returns:
+        The parsed agent configuration, shared between all interfaces of the role.
+    """
+    return load_agent_config(config_file)
+
+
+@lru_cache(maxsize=32)
+def _template_input_sets(config_file: str) -> frozenset[frozenset[str]]:
+    """
+    Collect the input names accepted by each interaction template of a role.
+
+    Args:
+        config_file: Path to the role configuration file.
+
+    Returns:
+        One set of input names per interaction template.
+    """
+    agent_config = _load_role_config(config_file)
+    return frozenset(
+        frozenset(input_var["name"] for input_var in template_configs["inputs"])
+        for template_configs in agent_config["interaction_templates"].values()
+    )
+
+
 class SessionService:
     """
     Business logic for session management operations.
@@ -25,14 +62,131 @@ class SessionService:
         """
         self.session_repo: SessionRepository = session_repo
         self.settings: Settings = settings
+        # caps the LLM calls in flight per worker, excess interactions wait here instead of piling onto the provider
+        self._llm_semaphore: asyncio.Semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_LLM)
+        # one lock per (session, role) so queued turns of a conversation run in arrival order
+        self._turn_locks: weakref.WeakValueDictionary[Tuple[str, str], asyncio.Lock] = weakref.WeakValueDictionary()
+        # live interfaces per (session, role), so a turn does not rebuild signatures and the LM client
+        self._llm_lru: OrderedDict[Tuple[str, str], LLMInterface] = OrderedDict()
+        # roles with a config file, scanned once so the request path does no filesystem checks
+        try:
+            config_files = os.listdir(settings.AGENT_CONFIGS_PATH)
+        except FileNotFoundError:
+            # without configs every role is unknown, which the endpoints report as such instead of failing
+            logger.error(f"Agent configs directory {settings.AGENT_CONFIGS_PATH} not found - no roles available")
+            config_files = []
+        self._valid_roles: frozenset[str] = frozenset(
+            file_name.removesuffix(".yaml") for file_name in config_files if file_name.endswith(".yaml")
+        )
+        self._role_paths: Dict[str, str] = {
+            role: os.path.join(settings.AGENT_CONFIGS_PATH, f"{role}.yaml") for role in self._valid_roles
+        }
+
+    def _turn_lock(self, session_id: str, role: str) -> asyncio.Lock:
+        """
+        Get the lock serializing the turns of a session role, creating it on first use.
+
+        Args:
+            session_id: Identifier of the session.
+            role: Role of the agent.
+
+        Returns:
+            The turn lock of the session role.
+        """
+        turn_lock = self._turn_locks.get((session_id, role))
+        if turn_lock is None:
+            turn_lock = self._turn_locks[(session_id, role)] = asyncio.Lock()
+        return turn_lock
+
+    async def _get_interface(
+        self,
+        session_id: str,
+        role: str,
+        agent_configs: Dict[str, Any],
+        past_messages: List[Dict[str, Any]],
+    ) -> LLMInterface:
+        """
+        Get the cached LLMInterface of a session role, building it on a miss.
+
+        The history always comes from the caller, since another worker may have advanced the conversation.
+
+        Args:
+            session_id: Identifier of the session.
+            role: Role of the agent.
+            agent_configs: Parsed configuration of the role.
+            past_messages: Current conversation history of the role.
+
+        Returns:
+            The LLMInterface object.
+        """
+        key = (session_id, role)
+        llm_interface = self._llm_lru.get(key)
+        if llm_interface is None:
+            # building the signatures and LM client is synchronous, keep it off the event loop
+            llm_interface = await asyncio.to_thread(LLMInterface, agent_configs)
+            self._llm_lru[key] = llm_interface
+            if len(self._llm_lru) > self.settings.LLM_LRU_SIZE:
+                self._llm_lru.popitem(last=False)
+        else:
+            self._llm_lru.move_to_end(key)
+
+        llm_interface.past_messages = past_messages
+        return llm_interface
+
+    async def load_role_config(self, role: str) -> Dict[str, Any]:
+        """
+        Load the agent configuration of a role off the event loop.
+
+        Args:
+            role: Agent role to load the configuration for.
 
-    async def initialize_session(self, session_id: str, role: str) -> LLMInterface:
+        Returns:
+            The parsed agent configuration.
+
+        Raises:
+            SessionNotFoundException: If the role configuration file is not found.
+        """
+        config_file = self._role_paths.get(role)
+        if config_file is None:
+            raise SessionNotFoundException(f"Role config not found for role '{role}'")
+
+        return await asyncio.to_thread(_load_role_config, config_file)
+
+    async def validate_input(self, role: str, input_data: Dict[str, Any]) -> None:
+        """
+        Check that the input matches one of the role's interaction templates.
+
+        Args:
+            role: Agent role the input is meant for.
+            input_data: Input data for the agent.
+
+        Raises:
+            SessionNotFoundException: If the role configuration file is not found.
+            InvalidInputException: If no interaction template takes exactly these inputs.
+        """
+        # warms the config cache off the event loop, so the lookup below does no I/O
+        await self.load_role_config(role)
+        if frozenset(input_data) not in _template_input_sets(self._role_paths[role]):
+            raise InvalidInputException(
+                f"No interaction template of role '{role}' takes the inputs: {sorted(input_data)}"
+            )
+
+    async def initialize_session(
+        self,
+        session_id: str,
+        role: str,
+        agent_configs: Dict[str, Any] | None = None,
+    ) -> LLMInterface:
         """
         Create and store a new session for the specified role.
 
+        Holds the turn lock of the session role, so a turn running on the cached interface
+        does not have its history reset underneath it.
+
         Args:
             session_id: Identifier of the session to initialize.
             role: Agent role to initialize the session.
+            agent_configs: Already loaded configuration of the role, if any.
 
         Returns:
             The LLMInterface object.
@@ -40,36 +194,58 @@ class SessionService:
         Raises:
             SessionNotFoundException: If the role configuration file is not found.
         """
-        # construct path to role config
-        config_dir = self.settings.AGENT_CONFIGS_PATH
-        config_file = os.path.join(config_dir, f"{role}.yaml")
-        if not os.path.isfile(config_file):
-            raise SessionNotFoundException(f"Role config not found for role '{role}'")
+        async with self._turn_lock(session_id, role):
+            return await self._initialize_session(session_id, role, agent_configs)
+
+    async def _initialize_session(
+        self,
+        session_id: str,
+        role: str,
+        agent_configs: Dict[str, Any] | None = None,
+    ) -> LLMInterface:
+        """
+        Create and store a new session for the specified role. The caller holds the turn lock.
+        """
+        if agent_configs is None:
+            agent_configs = await self.load_role_config(role)
 
-        # generate session ID and store session
+        # store session
         await self.session_repo.create(session_id, role)
-        return LLMInterface(config_file_path=config_file)
+        return await self._get_interface(session_id, role, agent_configs, [])
 
     async def get_session(self, session_id: str, role: str) -> LLMInterface:
         """
         Get the information about a session.
 
+        Holds the turn lock of the session role, since loading the history resets the cached interface.
+
         Args:
             session_id: Identifier of the session to get information about.
             role: Role of the agent to get information about.
 
         Returns:
             The LLMInterface object.
+
+        Raises:
+            SessionNotFoundException: If the role configuration file is not found.
         """
-        session_history = await self.session_repo.get_history(session_id)
+        async with self._turn_lock(session_id, role):
+            return await self._load_session(session_id, role)
+
+    async def _load_session(self, session_id: str, role: str) -> LLMInterface:
+        """
+        Get the interface of a session role with its stored history. The caller holds the turn lock.
+        """
+        # the config load and the history fetch are independent, overlap them
+        agent_configs, session_history = await asyncio.gather(
+            self.load_role_config(role),
+            self.session_repo.get_history(session_id),
+        )
         if not session_history or role not in session_history.keys():
             logger.info(f"Session history not found for role {role} in session {session_id} - initializing session")
-            return await self.initialize_session(session_id, role)
+            return await self._initialize_session(session_id, role, agent_configs)
 
-        return LLMInterface(
-            config_file_path=os.path.join(self.settings.AGENT_CONFIGS_PATH, f"{role}.yaml"),
-            past_messages=session_history[role].history,
-        )
+        return await self._get_interface(session_id, role, agent_configs, session_history[role].history)
 
     async def delete_session(self, session_id: str) -> None:
         """
@@ -81,12 +257,13 @@ class SessionService:
         Raises:
             SessionNotFoundException: If the session does not exist.
         """
-        session_history = await self.session_repo.get_history(session_id)
-        if not session_history:
+        # a single atomic delete, which reports a missing session instead of checking first
+        roles = await self.session_repo.delete_if_exists(session_id)
+        if roles is None:
             raise SessionNotFoundException(f"Session not found: {session_id}")
-        session = Session(session_id=session_id, roles=list(session_history.keys()))
 
-        await self.session_repo.delete(session)
+        for role in roles:
+            self._llm_lru.pop((session_id, role), None)
 
     async def submit_interact(
         self,
@@ -107,10 +284,28 @@ class SessionService:
         Returns:
             The response from the agent.
         """
+        # reject malformed input before any history is fetched or an interface is built
+        await self.validate_input(role, input_data)
 
-        llm_interface = await self.get_session(session_id, role)
-        response = await llm_interface.interact(**input_data)
-        await self.session_repo.save_past_messages(session_id, role, llm_interface.past_messages)
+        # each turn builds on the previous one's history, so turns of a conversation cannot share an LLM call
+        async with self._turn_lock(session_id, role):
+            llm_interface = await self._load_session(session_id, role)
+            turn_start = len(llm_interface.past_messages)
+            async with self._llm_semaphore:
+                response = await llm_interface.interact(**input_data)
+            # only the messages of this turn go to redis, the earlier ones are already stored.
+            # shielded so a caller that disconnects now does not lose a turn the LLM already answered
+            history_write = asyncio.ensure_future(
+                self.session_repo.append_history(session_id, role, llm_interface.past_messages[turn_start:])
+            )
+            try:
+                await asyncio.shield(history_write)
+            except asyncio.CancelledError:
+                # keep holding the turn lock until the write lands, so the next turn loads the full history
+                while not history_write.done():
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await asyncio.wait({history_write})
+                raise
         logger.info(f"Submitted interaction for {role} in session {session_id}")
         return response
 
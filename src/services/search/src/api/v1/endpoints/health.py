@@ -1,8 +1,13 @@
-from fastapi import APIRouter, status
+import orjson
+from fastapi import APIRouter, Response, status
+from fastapi.responses import ORJSONResponse
 
 from ....models.responses import HealthResponse
 
-router = APIRouter(tags=["Health"])
+router = APIRouter(tags=["Health"], default_response_class=ORJSONResponse)
+
+# the health payload never changes, so serialize it once at import time
+HEALTH_BODY: bytes = orjson.dumps(HealthResponse(status="healthy", service="search").model_dump())
 
 
 @router.get(
@@ -14,11 +19,11 @@ router = APIRouter(tags=["Health"])
         200: {"description": "Service is healthy"},
     },
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Health check endpoint for Docker and monitoring.
 
     Returns:
-        HealthResponse with service status
+        Pre-encoded HealthResponse body with service status
     """
-    return HealthResponse(status="healthy", service="search")
+    return Response(content=HEALTH_BODY, media_type="application/json")
@@ -1,13 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from loguru import logger
+from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import ORJSONResponse
 
-from ....core.dependencies import get_session_service
-from ....core.exceptions import SearchServiceException, map_to_http_exception
 from ....models.requests import SessionRequest
 from ....models.responses import SessionResponse
-from ....services.session_service import SessionService
 
-router = APIRouter(tags=["Session"])
+router = APIRouter(tags=["Session"], default_response_class=ORJSONResponse)
 
 
 @router.post(
@@ -23,8 +20,8 @@ router = APIRouter(tags=["Session"])
 )
 async def initialize_session(
     request: SessionRequest,
-    session_service: SessionService = Depends(get_session_service),
-) -> SessionResponse:
+    http_request: Request,
+) -> Response:
     """
     Initialize a new tree with the specified session ID.
 
@@ -36,18 +33,14 @@ async def initialize_session(
     Returns:
         SessionResponse with initialization status and tree information.
     """
-    try:
-        session = await session_service.get_or_create_session(request.session_id)
-        return SessionResponse(
-            session_id=session.session_id,
-            message="Session initialized successfully",
-            tree_size=len(session.tree.nodes),
-        )
-    except SearchServiceException as e:
-        raise map_to_http_exception(e)
-    except Exception as e:
-        logger.exception(f"Unexpected error initializing session: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    session_service = http_request.app.state.session_service
+    session = await session_service.get_or_create_session(request.session_id)
+    response = SessionResponse.model_construct(
+        session_id=session.session_id,
+        message="Session initialized successfully",
+        tree_size=len(session.tree.nodes),
+    )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -62,8 +55,8 @@ async def initialize_session(
 )
 async def get_session(
     session_id: str,
-    session_service: SessionService = Depends(get_session_service),
-) -> SessionResponse:
+    request: Request,
+) -> Response:
     """Get information about a specific session.
 
     Args:
@@ -72,15 +65,11 @@ async def get_session(
     Returns:
         SessionResponse with session information.
     """
-    try:
-        session = await session_service.get_session(session_id)
-        return SessionResponse(
-            session_id=session.session_id,
-            message="Session found",
-            tree_size=len(session.tree.nodes),
-        )
-    except SearchServiceException as e:
-        raise map_to_http_exception(e)
-    except Exception as e:
-        logger.exception(f"Unexpected error getting session: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    session_service = request.app.state.session_service
+    session = await session_service.get_session(session_id)
+    response = SessionResponse.model_construct(
+        session_id=session.session_id,
+        message="Session found",
+        tree_size=len(session.tree.nodes),
+    )
+    return Response(content=response.model_dump_json(), media_type="application/json")
@@ -1,16 +1,17 @@
 from typing import Optional
+from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
-from loguru import logger
+from fastapi import APIRouter, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 
-from ....core.dependencies import get_task_service
-from ....core.exceptions import SearchServiceException, map_to_http_exception
 from ....models.requests import TaskCreateRequest
 from ....models.responses import TaskResponse, TaskStatusResponse
-from ....services.task_service import TaskService
+from ....models.serialization import serialize_task
 
-router = APIRouter(tags=["Interaction"])
+router = APIRouter(tags=["Interaction"], default_response_class=ORJSONResponse)
+
+# TaskCreateRequest fields forwarded to TaskService.create_task when resuming
+RESUME_FIELDS = frozenset({"resume", "tree_pickle_path", "resume_phase", "resume_iteration"})
 
 
 @router.post(
@@ -25,9 +26,9 @@ router = APIRouter(tags=["Interaction"])
     },
 )
 async def run_mcts(
+    http_request: Request,
     request: Optional[TaskCreateRequest] = None,
-    task_service: TaskService = Depends(get_task_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Start MCTS execution asynchronously.
 
@@ -40,51 +41,21 @@ async def run_mcts(
     Returns:
         TaskResponse with task_id for status tracking.
     """
-    try:
-        # Use provided session_id or generate a new one
-        session_id = request.session_id if request else None
-        if not session_id:
-            from uuid import uuid4
-
-            session_id = str(uuid4())
-
-        # Extract resume parameters if provided
-        resume_kwargs = {}
-        if request and request.resume:
-            resume_kwargs = {
-                "resume": request.resume,
-                "tree_pickle_path": request.tree_pickle_path,
-                "resume_phase": request.resume_phase,
-                "resume_iteration": request.resume_iteration,
-            }
-
-        task = await task_service.create_task(session_id, **resume_kwargs)
-
-        return JSONResponse(
-            status_code=status.HTTP_202_ACCEPTED,
-            content=TaskResponse(
-                task_id=task.task_id,
-                session_id=task.session_id,
-                message="Request is being processed asynchronously",
-                phases={
-                    phase_name: {
-                        "status": phase.status,
-                        "created_at": phase.created_at.isoformat() if phase.created_at else None,
-                        "started_at": phase.started_at,
-                        "completed_at": phase.completed_at,
-                        "cancelled_at": phase.cancelled_at,
-                        "error": phase.error,
-                        "path": phase.path,
-                    }
-                    for phase_name, phase in task.phases.items()
-                },
-            ).model_dump(),
-        )
-    except SearchServiceException as e:
-        raise map_to_http_exception(e)
-    except Exception as e:
-        logger.exception(f"Unexpected error creating task: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    task_service = http_request.app.state.task_service
+    # Use provided session_id or generate a new one
+    session_id = request.session_id if request else None
+    if not session_id:
+        session_id = uuid4().hex
+
+    # Extract resume parameters if provided
+    resume_kwargs = request.model_dump(include=RESUME_FIELDS) if request and request.resume else {}
+
+    task = await task_service.create_task(session_id, **resume_kwargs)
+
+    return ORJSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=serialize_task(task, "Request is being processed asynchronously"),
+    )
 
 
 @router.post(
@@ -100,8 +71,8 @@ async def run_mcts(
 )
 async def stop_task(
     task_id: str,
-    task_service: TaskService = Depends(get_task_service),
-) -> TaskResponse:
+    request: Request,
+) -> ORJSONResponse:
     """
     Stop a running MCTS task.
 
@@ -114,30 +85,12 @@ async def stop_task(
     Returns:
         TaskResponse with the result of the stop operation and updated phase statuses.
     """
-    try:
-        task = await task_service.stop_task(task_id)
-        return TaskResponse(
-            task_id=task.task_id,
-            session_id=task.session_id,
-            message="Task cancelled successfully",
-            phases={
-                phase_name: {
-                    "status": phase.status,
-                    "created_at": phase.created_at.isoformat() if phase.created_at else None,
-                    "started_at": phase.started_at,
-                    "completed_at": phase.completed_at,
-                    "cancelled_at": phase.cancelled_at,
-                    "error": phase.error,
-                    "path": phase.path,
-                }
-                for phase_name, phase in task.phases.items()
-            },
-        )
-    except SearchServiceException as e:
-        raise map_to_http_exception(e)
-    except Exception as e:
-        logger.exception(f"Unexpected error stopping task: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    task_service = request.app.state.task_service
+    task = await task_service.stop_task(task_id)
+    # return the body directly, skipping model validation and jsonable_encoder
+    return ORJSONResponse(
+        content=serialize_task(task, "Task cancelled successfully"),
+    )
 
 
 @router.get(
@@ -150,27 +103,25 @@ async def stop_task(
     },
 )
 async def get_status(
-    task_service: TaskService = Depends(get_task_service),
-) -> TaskStatusResponse:
+    request: Request,
+) -> Response:
     """
     Get the status of all tasks.
 
     Returns:
         TaskStatusResponse with the status of all tasks.
     """
-    try:
-        status_report = await task_service.get_task_status_report()
-
-        if "message" in status_report:
-            # No tasks to report
-            return TaskStatusResponse(message=status_report["message"])
-        else:
-            # Return task statuses
-            return TaskStatusResponse(tasks=status_report)
+    task_service = request.app.state.task_service
+    status_report = await task_service.get_task_status_report()
 
-    except Exception as e:
-        logger.exception(f"Error getting task status: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    if "message" in status_report:
+        # No tasks to report
+        response = TaskStatusResponse.model_construct(message=status_report["message"])
+    else:
+        # Return task statuses
+        response = TaskStatusResponse.model_construct(tasks=status_report)
+    # serialize straight to JSON in pydantic-core instead of dumping, re-validating and re-encoding in FastAPI
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -185,38 +136,30 @@ async def get_status(
 )
 async def get_task_status(
     task_id: str,
-    task_service: TaskService = Depends(get_task_service),
-) -> TaskResponse:
+    request: Request,
+    wait: float = Query(
+        0,
+        ge=0,
+        le=300,
+        description="Seconds to hold the request open until the task finishes (long-poll)",
+    ),
+) -> ORJSONResponse:
     """
     Get the status of a specific task.
 
+    With `wait` set, the request is held open until the task finishes or the wait
+    elapses, so clients can long-poll instead of polling in a tight loop.
+
     Args:
         task_id: The ID of the task to get the status of.
+        wait: Maximum number of seconds to wait for the task to finish.
 
     Returns:
         TaskResponse with the status of the task.
     """
-    try:
-        task = await task_service.get_task(task_id)
-        return TaskResponse(
-            task_id=task.task_id,
-            session_id=task.session_id,
-            message=f"Task status: {task.status.value}",
-            phases={
-                phase_name: {
-                    "status": phase.status,
-                    "created_at": phase.created_at.isoformat() if phase.created_at else None,
-                    "started_at": phase.started_at,
-                    "completed_at": phase.completed_at,
-                    "cancelled_at": phase.cancelled_at,
-                    "error": phase.error,
-                    "path": phase.path,
-                }
-                for phase_name, phase in task.phases.items()
-            },
-        )
-    except SearchServiceException as e:
-        raise map_to_http_exception(e)
-    except Exception as e:
-        logger.exception(f"Error getting task {task_id}: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    task_service = request.app.state.task_service
+    task = await task_service.wait_for_task(task_id, wait)
+    # return the body directly, skipping model validation and jsonable_encoder
+    return ORJSONResponse(
+        content=serialize_task(task, f"Task status: {task.status.value}"),
+    )
@@ -1,12 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException
-from loguru import logger
+from typing import Optional
+
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse
 
-from ....core.dependencies import get_session_service
-from ....core.exceptions import SearchServiceException, map_to_http_exception
 from ....models.responses import TreeDataResponse
-from ....services.session_service import SessionService
 
-router = APIRouter(tags=["Tree"])
+router = APIRouter(tags=["Tree"], default_response_class=ORJSONResponse)
+
+
+def _if_none_match(header: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an etag with the weak comparison of RFC 9110 section 13.1.2.
+
+    Args:
+        header: The If-None-Match header value, if any
+        etag: The current strong etag of the resource
+
+    Returns:
+        True if the header lists the etag, either form of it, or `*`
+    """
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
 
 
 @router.get(
@@ -15,29 +34,28 @@ router = APIRouter(tags=["Tree"])
     summary="Get the current MCTS tree data for a session",
     responses={
         200: {"description": "Tree data successfully retrieved"},
+        304: {"description": "Tree unchanged since the version given in If-None-Match"},
         404: {"description": "Session ID not found"},
-        500: {"description": "Error serializing tree data"},
+        500: {"description": "Internal server error"},
     },
 )
 async def get_tree_data(
     session_id: str,
-    session_service: SessionService = Depends(get_session_service),
-) -> TreeDataResponse:
+    request: Request,
+) -> Response:
     """
     Retrieves the current state of the MCTS tree for the given session ID,
-    serialized to a dictionary.
+    serialized to a dictionary. Responses carry an ETag that changes whenever the tree does,
+    so pollers can send If-None-Match and get a 304 while the tree is unchanged.
 
     Args:
         session_id: The session ID to retrieve tree data for
 
     Returns:
-        TreeDataResponse with the tree structure and metadata
+        TreeDataResponse body with the tree structure and metadata
     """
-    try:
-        tree_dict = await session_service.get_session_tree_data(session_id)
-        return TreeDataResponse(**tree_dict)
-    except SearchServiceException as e:
-        raise map_to_http_exception(e)
-    except Exception as e:
-        logger.exception(f"Error serializing tree for session {session_id}: {e}")
-        raise HTTPException(status_code=500, detail=f"Error serializing tree data: {str(e)}")
+    session_service = request.app.state.session_service
+    etag, body = await session_service.get_session_tree_json(session_id)
+    if _if_none_match(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
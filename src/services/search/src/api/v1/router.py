@@ -1,9 +1,10 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from .endpoints import health, sessions, tasks, trees
 
 # Create the main v1 router
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include all endpoint routers
 router.include_router(sessions.router)
@@ -6,6 +6,12 @@ import yaml
 from loguru import logger
 from pydantic import BaseModel
 
+# prefer the libyaml-backed loader, it parses several times faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader
+
 
 class PhaseParametersConfig(BaseModel):
     """
@@ -22,6 +28,7 @@ class PhaseParametersConfig(BaseModel):
     task_timeout: float = 180.0  # task timeout in seconds (default: 3 minutes)
     node_selection_threshold: float = 0.5
     variations_per_concept: int = 5
+    save_every: int = 10  # iterations between intermediate tree checkpoints
 
     class Config:
         extra = "allow"  # allow additional phase-specific fields
@@ -141,7 +148,7 @@ def load_yaml_config(config_path: str) -> Dict[str, Any]:
 
     with open(config_path, "r") as f:
         try:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Error parsing YAML config: {e}")
 
@@ -174,24 +181,24 @@ def get_settings() -> Settings:
     experiment_config = load_yaml_config(experiment_config_path)
 
     # build phase configs dictionary - each phase gets all its parameters
-    phase_configs = {}
-    for phase_name, phase_data in phase_config.items():
-        phase_configs[phase_name] = PhaseConfig(
-            phase_params=PhaseParametersConfig(**phase_data["phase_params"] if "phase_params" in phase_data else {}),
-            search_params=PhaseSearchParametersConfig(
-                **phase_data["search_params"] if "search_params" in phase_data else {}
-            ),
-            scoring_params=PhaseScoringParametersConfig(
-                **phase_data["scoring_params"] if "scoring_params" in phase_data else {}
-            ),
-            environment=PhaseEnvironmentConfig(**phase_data["environment"] if "environment" in phase_data else {}),
-        )
-
-    # create settings from the loaded configs
-    settings = Settings(
-        tree_config=TreeConfig(**tree_config["tree_configs"]),
-        phase_configs=phase_configs,
-        experiment_config=ExperimentConfig(**experiment_config),
+    phase_configs = {
+        phase_name: {
+            "phase_params": phase_data.get("phase_params", {}),
+            "search_params": phase_data.get("search_params", {}),
+            "scoring_params": phase_data.get("scoring_params", {}),
+            "environment": phase_data.get("environment", {}),
+        }
+        for phase_name, phase_data in phase_config.items()
+    }
+
+    # create settings from the loaded configs. validating the raw dicts in one call lets pydantic-core
+    # build the whole nested config tree, instead of constructing each sub-model from Python
+    settings = Settings.model_validate(
+        {
+            "tree_config": tree_config["tree_configs"],
+            "phase_configs": phase_configs,
+            "experiment_config": experiment_config,
+        }
     )
 
     logger.info(f"Initialized settings: {settings.app_name} v{settings.version}")
@@ -1,65 +1,85 @@
-from functools import lru_cache
-
 from ..core.config import Settings, get_settings
 from ..repositories import SessionRepository, TaskRepository
 from ..services import MCTSService, SessionService, TaskService
 
+# dependency singletons. each is built on first use and then returned as a plain global read,
+# which is cheaper per request than going through an lru_cache wrapper.
+_settings: Settings | None = None
+_session_repository: SessionRepository | None = None
+_task_repository: TaskRepository | None = None
+_session_service: SessionService | None = None
+_mcts_service: MCTSService | None = None
+_task_service: TaskService | None = None
+
 
 # configuration dependencies
 def get_config_settings() -> Settings:
     """
     Get application settings.
     """
-    return get_settings()
+    global _settings
+    if _settings is None:
+        _settings = get_settings()
+    return _settings
 
 
 # repository dependencies
-@lru_cache()
 def get_session_repository() -> SessionRepository:
     """
     Get session repository instance.
     """
-    return SessionRepository()
+    global _session_repository
+    if _session_repository is None:
+        _session_repository = SessionRepository()
+    return _session_repository
 
 
-@lru_cache()
 def get_task_repository() -> TaskRepository:
     """
     Get task repository instance.
     """
-    return TaskRepository()
+    global _task_repository
+    if _task_repository is None:
+        _task_repository = TaskRepository()
+    return _task_repository
 
 
 # service dependencies
-@lru_cache()
 def get_session_service() -> SessionService:
     """
     Get session service instance.
     """
-    return SessionService(
-        session_repo=get_session_repository(),
-        settings=get_config_settings(),
-    )
+    global _session_service
+    if _session_service is None:
+        _session_service = SessionService(
+            session_repo=get_session_repository(),
+            settings=get_config_settings(),
+        )
+    return _session_service
 
 
-@lru_cache()
 def get_mcts_service() -> MCTSService:
     """
     Get MCTS service instance.
     """
-    return MCTSService(
-        settings=get_config_settings(),
-    )
+    global _mcts_service
+    if _mcts_service is None:
+        _mcts_service = MCTSService(
+            settings=get_config_settings(),
+        )
+    return _mcts_service
 
 
-@lru_cache()
 def get_task_service() -> TaskService:
     """
     Get task service instance.
     """
-    return TaskService(
-        task_repo=get_task_repository(),
-        session_service=get_session_service(),
-        mcts_service=get_mcts_service(),
-        settings=get_config_settings(),
-    )
+    global _task_service
+    if _task_service is None:
+        _task_service = TaskService(
+            task_repo=get_task_repository(),
+            session_service=get_session_service(),
+            mcts_service=get_mcts_service(),
+            settings=get_config_settings(),
+        )
+    return _task_service
@@ -1,3 +1,6 @@
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
 from fastapi import HTTPException, status
 
 
@@ -65,17 +68,9 @@ class MCTSExecutionException(SearchServiceException):
     pass
 
 
-def map_to_http_exception(exc: SearchServiceException) -> HTTPException:
-    """
-    Map custom exceptions to HTTP exceptions.
-
-    Args:
-        exc: The custom exception to map
-
-    Returns:
-        HTTPException with appropriate status code and detail
-    """
-    mapping = {
+# exception type -> (status code, detail). built once instead of on every mapped exception
+_EXC_MAPPING: Mapping[type, Tuple[int, str]] = MappingProxyType(
+    {
         SessionNotFoundException: (
             status.HTTP_404_NOT_FOUND,
             "Session not found",
@@ -105,6 +100,18 @@ def map_to_http_exception(exc: SearchServiceException) -> HTTPException:
             "MCTS execution failed",
         ),
     }
+)
 
-    status_code, detail = mapping.get(type(exc), (status.HTTP_500_INTERNAL_SERVER_ERROR, str(exc)))
+
+def map_to_http_exception(exc: SearchServiceException) -> HTTPException:
+    """
+    Map custom exceptions to HTTP exceptions.
+
+    Args:
+        exc: The custom exception to map
+
+    Returns:
+        HTTPException with appropriate status code and detail
+    """
+    status_code, detail = _EXC_MAPPING.get(exc.__class__, (status.HTTP_500_INTERNAL_SERVER_ERROR, str(exc)))
     return HTTPException(status_code=status_code, detail=detail)
@@ -2,8 +2,16 @@ import os
 from typing import Any, Dict
 
 import httpx
+import orjson
 from loguru import logger
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # httpx[http2] not installed
+    HTTP2_AVAILABLE = False
+
 
 class EnvironmentClient:
     """Client for interacting with the Environment Service API."""
@@ -34,6 +42,21 @@ class EnvironmentClient:
         # TODO:fix this to load from environment settings config later
         self.timeout = 300
 
+        # one pooled client for the lifetime of the environment, so challenge runs reuse keep-alive connections.
+        # http/2 is negotiated over TLS only; when available, concurrent challenge runs share one multiplexed connection
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+            http2=HTTP2_AVAILABLE and self.base_url.startswith("https://"),
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP connection pool.
+        """
+        await self._client.aclose()
+
     async def run_challenge(self, **kwargs) -> Dict[str, Any]:
         """
         Run a coding challenge via the environment service API.
@@ -65,10 +88,14 @@ class EnvironmentClient:
 
             logger.debug(f"Running challenge with environment '{self.name}' and request: {request_body}")
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(f"{self.base_url}/run-challenge", json=request_body, params=params)
-                response.raise_for_status()
-                return response.json()
+            response = await self._client.post(
+                "/run-challenge",
+                content=orjson.dumps(request_body),
+                params=params,
+                headers={"Content-Type": "application/json"},
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
         except httpx.TimeoutException as e:
             error_msg = f"Timeout error after {self.timeout}s when calling {self.base_url}/run-challenge"
@@ -1,10 +1,14 @@
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from loguru import logger
 
 from .api.v1.router import router as v1_router
+from .core.dependencies import get_config_settings, get_session_service, get_task_service
+from .core.exceptions import SearchServiceException, map_to_http_exception
 
 # Define API metadata and tags
 tags_metadata = [
@@ -27,6 +31,19 @@ tags_metadata = [
 ]
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Builds the shared services once at startup and exposes them on `app.state`,
+    so endpoints read them directly instead of resolving them through `Depends` per request.
+    """
+    app.state.settings = get_config_settings()
+    app.state.session_service = get_session_service()
+    app.state.task_service = get_task_service()
+    logger.info("Search services initialized")
+    yield
+
+
 def create_app() -> FastAPI:
     """
     Application factory for creating the FastAPI app.
@@ -34,6 +51,9 @@ def create_app() -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application instance
     """
+    # load the YAML configs before serving, so no request ever pays for the blocking file reads
+    get_config_settings()
+
     # Initialize FastAPI app
     app = FastAPI(
         title="PrismBench Search Interface",
@@ -43,8 +63,22 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
+    # catch-all for unexpected errors. registered before CORS so it runs inside it and the 500 still carries
+    # the CORS headers; an exception handler for Exception would run in ServerErrorMiddleware, outside CORS
+    @app.middleware("http")
+    async def unexpected_exception_middleware(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        try:
+            return await call_next(request)
+        except Exception as exc:
+            logger.exception(f"Unexpected error handling {request.method} {request.url.path}: {exc}")
+            return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -57,6 +91,12 @@ def create_app() -> FastAPI:
     # Include the v1 router
     app.include_router(v1_router)
 
+    # map service errors to HTTP responses once here, instead of a try/except in every endpoint
+    @app.exception_handler(SearchServiceException)
+    async def search_service_exception_handler(request: Request, exc: SearchServiceException) -> ORJSONResponse:
+        http_exc = map_to_http_exception(exc)
+        return ORJSONResponse(status_code=http_exc.status_code, content={"detail": http_exc.detail})
+
     # Add a root endpoint
     @app.get("/")
     async def root() -> Dict[str, Any]:
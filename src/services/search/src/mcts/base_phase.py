@@ -1,5 +1,6 @@
 import asyncio
 import os
+import random
 from datetime import datetime
 from typing import Callable, Dict
 
@@ -10,6 +11,9 @@ from ..environment_client import EnvironmentClient
 from ..mcts.phase_registry import phase_registry
 from ..tree import ChallengeNode, Tree
 
+# root directory for experiment outputs, resolved once per process
+EXPERIMENTS_ROOT = os.path.join(os.getcwd(), "experiments")
+
 
 class BasePhase:
     """
@@ -45,6 +49,8 @@ class BasePhase:
         self.phase_name = phase_name
         self.tree = tree
         self.environment = environment
+        # strategy methods bound once per phase, so each call skips the registry lookups
+        self._phase_methods: Dict[str, Callable] = dict(phase_registry.phases.get(phase_name, {})) if phase_name else {}
 
         # set phase parameters
         self.phase_params = PhaseParametersConfig(**config["phase_params"])
@@ -59,11 +65,16 @@ class BasePhase:
 
         # set of nodes that are being expanded. used to avoid conflicts when selecting nodes
         self.nodes_being_expanded = set()
+        # ids of nodes whose evaluation task has finished, pushed by each task's done callback
+        self._completed_nodes: asyncio.Queue = asyncio.Queue()
+        # tree renders running in the default executor, drained before run() returns
+        self._pending_renders: set[asyncio.Future] = set()
 
         timestamp = datetime.now().strftime("%m%d_%H%M")
         experiment_name = f"{timestamp}_{self.phase_name or str(self.__class__)}_{self.phase_params.max_depth}"
-        path = os.path.join(os.getcwd(), "experiments", experiment_name)
-        os.makedirs(path, exist_ok=True)
+        path = os.path.join(EXPERIMENTS_ROOT, experiment_name)
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
         self.path = path
 
         logger.info(f"Initialized {self.phase_name or str(self.__class__)} with experiment path: {path}")
@@ -85,6 +96,7 @@ class BasePhase:
         try:
             strategy_method = self._get_phase_method("initialize_phase")
             await strategy_method(self)
+            self.tree.mark_modified()
             logger.info(f"Phase {self.phase_name} initialized")
         except NotImplementedError:
             logger.warning(f"No initialize_phase method found for phase {self.phase_name}")
@@ -104,6 +116,12 @@ class BasePhase:
         # Handle resume iteration
         iteration = getattr(self, "_starting_iteration", 0)  # keep track of the number of iterations
         running_tasks = {}  # keep track of the running tasks
+        last_saved_iteration = iteration  # iteration of the last intermediate checkpoint
+
+        # loop-invariant phase parameters, read once instead of on every iteration
+        max_iterations = self.phase_params.max_iterations
+        convergence_checks = self.phase_params.convergence_checks
+        save_every = self.phase_params.save_every
 
         # initialize the phase - skip if resuming from same phase at iteration > 0
         if iteration == 0:
@@ -112,46 +130,49 @@ class BasePhase:
             logger.info(f"Skipping initialization, resuming from iteration {iteration}")
 
         try:
-            while not self.convergence and iteration < self.phase_params.max_iterations:
+            while not self.convergence and iteration < max_iterations:
                 # fill the task queue with new nodes
                 await self.fill_task_queue(running_tasks)
                 # wait for at least one task to complete before re-evaluating
                 # and adding new nodes to running tasks
                 if running_tasks:
-                    done, pending = await asyncio.wait(
-                        running_tasks.values(),
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
-                    logger.debug(f"Tasks completed: {len(done)}, pending: {len(pending)}")
+                    completed_ids = [await self._completed_nodes.get()]
+                    # drain everything else that finished in the meantime
+                    while not self._completed_nodes.empty():
+                        completed_ids.append(self._completed_nodes.get_nowait())
 
                     # remove completed tasks from running tasks
-                    completed_ids = [nid for nid, task in running_tasks.items() if task in done]
                     for nid in completed_ids:
                         del running_tasks[nid]
+                    logger.debug("Tasks completed: {}, pending: {}", len(completed_ids), len(running_tasks))
 
                     # increment iteration count by the number of completed tasks
-                    iteration += len(done)
+                    iteration += len(completed_ids)
                 else:
                     iteration += 1
 
-                if self.no_change_iterations >= self.phase_params.convergence_checks:
+                if self.no_change_iterations >= convergence_checks:
                     logger.info(
                         f"Convergence achieved after {iteration} iterations (no changes for {self.no_change_iterations} iterations)"
                     )
                     self.convergence = True
                 else:
-                    logger.debug(f"Iteration {iteration}: No change iterations: {self.no_change_iterations}")
+                    logger.debug("Iteration {}: No change iterations: {}", iteration, self.no_change_iterations)
 
                 # Log progress every 10 iterations
                 if iteration % 10 == 0:
                     logger.info(
-                        f"Progress: Iteration {iteration}/{self.phase_params.max_iterations}, Tree size: {len(self.tree.nodes)} nodes"
+                        f"Progress: Iteration {iteration}/{max_iterations}, Tree size: {len(self.tree.nodes)} nodes"
                     )
 
-                self.save_progress(
-                    self.path,
-                    f"{self.phase_name}_iteration_{iteration}",
-                )
+                # checkpoint the tree every `save_every` iterations; rendering is left to the final save
+                if iteration - last_saved_iteration >= save_every:
+                    self.save_progress(
+                        self.path,
+                        f"{self.phase_name}_iteration_{iteration}",
+                        visualize=False,
+                    )
+                    last_saved_iteration = iteration
 
         except asyncio.CancelledError:
             logger.warning("Search cancelled, stopping all tasks")
@@ -175,6 +196,8 @@ class BasePhase:
             self.path,
             f"{self.phase_name}_final",
         )
+        if self._pending_renders:
+            await asyncio.gather(*self._pending_renders)
 
     async def fill_task_queue(
         self,
@@ -190,10 +213,9 @@ class BasePhase:
         Returns:
             None
         """
-        while len(running_tasks) < self.phase_params.num_nodes_per_iteration:
-            logger.debug(
-                f"Task queue status: {len(running_tasks)}/{self.phase_params.num_nodes_per_iteration} tasks running"
-            )
+        num_nodes_per_iteration = self.phase_params.num_nodes_per_iteration
+        while len(running_tasks) < num_nodes_per_iteration:
+            logger.debug("Task queue status: {}/{} tasks running", len(running_tasks), num_nodes_per_iteration)
 
             # initialize node selection with retry mechanism
             selected_node = None
@@ -204,33 +226,57 @@ class BasePhase:
             while not selected_node and attempts < max_attempts:
                 attempts += 1
                 candidate = await self.select_node()
-                logger.debug(f"Node selection attempt {attempts}: candidate {candidate.id} ({candidate.concepts})")
+                logger.debug("Node selection attempt {}: candidate {} ({})", attempts, candidate.id, candidate.concepts)
 
                 # check for node conflicts
                 # make sure that the selected node is not a parent of any already running or being expanded nodes
                 if await self.check_for_node_conflicts(candidate, running_tasks):
                     selected_node = candidate
-                    logger.debug(f"Selected valid node: {selected_node.id}")
+                    logger.debug("Selected valid node: {}", selected_node.id)
                 else:
-                    logger.debug(f"Node {candidate.id} conflicts with running/expanding nodes, retrying")
-                # yield control back to main loop in case of cancellation
-                await asyncio.sleep(0)
+                    logger.debug("Node {} conflicts with running/expanding nodes, retrying", candidate.id)
+                # yield control back to main loop every few attempts in case of cancellation
+                if attempts % 4 == 0:
+                    await asyncio.sleep(0)
 
-            # if we couldn't find a valid node after max attempts, wait briefly and continue outer loop
+            # if we couldn't find a valid node after max attempts, wait until a running task finishes
+            # (its node may be what blocks selection) or 2 seconds pass, whichever comes first
             if not selected_node:
-                logger.warning(f"Failed to find eligible node after {max_attempts} attempts, waiting 2 seconds")
-                await asyncio.sleep(2)
-                continue
+                logger.warning(f"Failed to find eligible node after {max_attempts} attempts, waiting up to 2 seconds")
+                try:
+                    nid = await asyncio.wait_for(self._completed_nodes.get(), timeout=2)
+                except asyncio.TimeoutError:
+                    continue
+                # hand the completion back to run(), which frees the finished node before selecting again
+                self._completed_nodes.put_nowait(nid)
+                return
 
             logger.debug(
-                f"Creating evaluation task for node {selected_node.id} ({selected_node.concepts}, {selected_node.difficulty})"
+                "Creating evaluation task for node {} ({}, {})",
+                selected_node.id,
+                selected_node.concepts,
+                selected_node.difficulty,
             )
+            # apply virtual loss so concurrent selections steer away from this node until it is evaluated
+            selected_node.virtual_loss += 1
             # timeout is now handled internally within evaluate_node_task
             task = asyncio.create_task(self.evaluate_node_task(selected_node))
+            task.add_done_callback(lambda _, node=selected_node: self._release_node(node))
 
             running_tasks[selected_node.id] = task
 
-            logger.debug(f"Task queue updated: {len(running_tasks)} tasks now running")
+            logger.debug("Task queue updated: {} tasks now running", len(running_tasks))
+
+    def _release_node(self, node: ChallengeNode) -> None:
+        """
+        Done callback of an evaluation task: reverts the virtual loss applied in fill_task_queue and
+        reports the node as finished to run(). Runs even if the task was cancelled before it started.
+
+        Args:
+            node (ChallengeNode): The node whose evaluation task finished.
+        """
+        node.virtual_loss -= 1
+        self._completed_nodes.put_nowait(node.id)
 
     async def check_for_node_conflicts(
         self,
@@ -248,13 +294,12 @@ class BasePhase:
             bool: True if there are no conflicts, False otherwise.
         """
         # get candidate's ID and ancestors
-        candidate_and_ancestors = {candidate_node.id} | set(candidate_node.get_node_ancestors_ids())
+        candidate_and_ancestors = candidate_node.get_node_ancestors_ids_cached() | {candidate_node.id}
 
         # check if any related node is already running or being expanded
-        running_conflict = any(nid in running_tasks for nid in candidate_and_ancestors)
-        expansion_conflict = any(nid in self.nodes_being_expanded for nid in candidate_and_ancestors)
-
-        return not (running_conflict or expansion_conflict)
+        return candidate_and_ancestors.isdisjoint(running_tasks) and candidate_and_ancestors.isdisjoint(
+            self.nodes_being_expanded
+        )
 
     async def evaluate_node_task(
         self,
@@ -305,20 +350,33 @@ class BasePhase:
             logger.exception(f"Error selecting node: {e}")
             raise
 
-    async def _timeout_task(self, timeout: float, node_id: str) -> None:
+    def descend_to_leaf(self, node: ChallengeNode) -> ChallengeNode:
         """
-        Background task that raises TimeoutError after the specified timeout.
+        Traverses from the given node down to a leaf, shared by the select_node strategies.
+        At each level a random child is taken with probability exploration_probability,
+        otherwise the child with the highest UCB1 value.
 
         Args:
-            timeout (float): The timeout limit in seconds.
-            node_id (str): The node ID for logging purposes.
+            node (ChallengeNode): The node to start the descent from.
 
-        Raises:
-            asyncio.TimeoutError: After the timeout period elapses.
-        """
-        await asyncio.sleep(timeout)
-        logger.warning(f"Timeout triggered for node {node_id} after {timeout} seconds")
-        raise asyncio.TimeoutError(f"Operation timed out after {timeout} seconds")
+        Returns:
+            ChallengeNode: The leaf node reached.
+        """
+        exploration_probability = self.phase_params.exploration_probability
+        rand = random.random
+        ucb1 = ChallengeNode.ucb1
+
+        while node.children:
+            # random probability of selecting a child node
+            if rand() < exploration_probability:
+                node = random.choice(node.children)
+                logger.debug("Random child exploration: selected {} ({}, {})", node.id, node.concepts, node.difficulty)
+            # otherwise, select the best child node based on UCB1
+            else:
+                node = max(node.children, key=ucb1)
+                logger.debug("UCB1 child selection: selected {} ({}, {})", node.id, node.concepts, node.difficulty)
+
+        return node
 
     async def evaluate_node(
         self,
@@ -338,16 +396,15 @@ class BasePhase:
             None
         """
         strategy_method = self._get_phase_method("evaluate_node")
-        timeout_task = None
-        evaluation_task = None
 
         try:
             logger.debug(f"Starting evaluation of node {node.id} ({node.concepts}, {node.difficulty})")
 
-            # Create the main evaluation task
+            # the main evaluation coroutine
             async def _run_evaluation():
                 # evaluate node
                 evaluation_results = await strategy_method(self, node)
+                self.tree.mark_modified()
                 logger.debug(
                     f"Node {node.id} evaluation completed with success: {evaluation_results.get('success', False)}"
                 )
@@ -373,9 +430,7 @@ class BasePhase:
 
                 # backpropagate node value
                 self.backpropagate_node_value(node, node_value)
-
-                # yield control back to main loop in case of cancellation
-                await asyncio.sleep(0)
+                self.tree.mark_modified()
 
                 # Check for convergence
                 value_delta = abs(node.value - previous_node_value)
@@ -397,53 +452,16 @@ class BasePhase:
 
                 return evaluation_results
 
-            # Create tasks for evaluation and timeout
-            evaluation_task = asyncio.create_task(_run_evaluation())
-
             if timeout is not None:
-                timeout_task = asyncio.create_task(self._timeout_task(timeout, node.id))
-
-                # Race the evaluation against the timeout
-                done, pending = await asyncio.wait([evaluation_task, timeout_task], return_when=asyncio.FIRST_COMPLETED)
-
-                # Cancel any pending tasks
-                for task in pending:
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-
-                # Check which task completed first
-                completed_task = done.pop()
-                if completed_task == timeout_task:
-                    # Timeout occurred, get the exception
-                    await completed_task  # This will raise TimeoutError
-                else:
-                    # Evaluation completed normally, get the result
-                    await completed_task
+                # wait_for cancels the evaluation itself once the timeout elapses
+                await asyncio.wait_for(_run_evaluation(), timeout=timeout)
             else:
                 # No timeout specified, just run the evaluation
-                await evaluation_task
+                await _run_evaluation()
 
         except Exception as e:
             logger.error(f"Error during evaluation of node {node.id} ({node.concepts}): {e}")
 
-            # Clean up tasks if they exist
-            if evaluation_task and not evaluation_task.done():
-                evaluation_task.cancel()
-                try:
-                    await evaluation_task
-                except asyncio.CancelledError:
-                    pass
-
-            if timeout_task and not timeout_task.done():
-                timeout_task.cancel()
-                try:
-                    await timeout_task
-                except asyncio.CancelledError:
-                    pass
-
             self.nodes_being_expanded.discard(node.id)
             if node.depth > 1 and not node.children:  # don't remove root node or nodes with children
                 self.tree.remove_node(node)
@@ -535,10 +553,10 @@ class BasePhase:
         """
         strategy_method = self._get_phase_method("expand_node")
 
-        node_and_ancestors = {node.id} | set(node.get_node_ancestors_ids())
+        node_and_ancestors = node.get_node_ancestors_ids_cached() | {node.id}
 
         # If any of these nodes are being expanded elsewhere, skip expansion
-        if any(nid in self.nodes_being_expanded for nid in node_and_ancestors):
+        if not node_and_ancestors.isdisjoint(self.nodes_being_expanded):
             logger.debug(f"Skipping expansion of node {node.id} - ancestor already being expanded")
             return
 
@@ -566,9 +584,14 @@ class BasePhase:
         Raises:
             NotImplementedError: If no strategy is found for the method
         """
+        phase_method = self._phase_methods.get(method_name)
+        if phase_method is not None:
+            return phase_method
+
         if self.phase_name:
             phase_method = phase_registry.get_phase_method(self.phase_name, method_name)
             if phase_method:
+                self._phase_methods[method_name] = phase_method
                 return phase_method
 
         raise NotImplementedError(
@@ -581,17 +604,26 @@ class BasePhase:
         self,
         path: str,
         iteration: str,
+        visualize: bool = True,
     ) -> None:
         """
         Saves the current state of the tree and its visualization.
+        The visualization is rendered in the background; `run` waits for pending renders before returning.
+        Must be called from within the running event loop.
 
         Args:
             path (str): The directory path where the files will be saved.
             iteration (str): The current iteration number or 'final'.
+            visualize (bool): Whether to also render the tree visualization. Defaults to True.
         """
         logger.debug(f"Saving progress for phase {self.phase_name} iteration {iteration}")
 
-        file_prefix = f"{self.phase_name}_tree_{iteration}"
+        file_path = os.path.join(path, f"{self.phase_name}_tree_{iteration}")
 
-        self.tree.save_tree(file_name=os.path.join(path, file_prefix))
-        self.tree.visualize_tree(file_name=os.path.join(path, file_prefix))
+        self.tree.save_tree(file_name=file_path)
+        if visualize:
+            # build the graph here, against a consistent tree, and leave the slow graphviz render to a worker thread
+            dot = self.tree.build_visualization()
+            render = asyncio.get_running_loop().run_in_executor(None, self.tree.render_visualization, dot, file_path)
+            self._pending_renders.add(render)
+            render.add_done_callback(self._pending_renders.discard)
@@ -1,4 +1,5 @@
 import random
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Dict
 
 from loguru import logger
@@ -9,6 +10,18 @@ from ..tree import ChallengeNode
 if TYPE_CHECKING:
     from ..mcts.base_phase import BasePhase
 
+# base score multiplier per difficulty level, and the highest base score it allows
+DIFFICULTY_WEIGHTS = MappingProxyType(
+    {
+        "very easy": 1,
+        "easy": 1.5,
+        "medium": 2,
+        "hard": 2.5,
+        "very hard": 3,
+    }
+)
+MAX_BASE_SCORE = 10 * max(DIFFICULTY_WEIGHTS.values())
+
 
 @phase_registry.register_phase_method("phase_1", "select_node")
 async def select_node(self: "BasePhase") -> ChallengeNode:
@@ -23,42 +36,30 @@ async def select_node(self: "BasePhase") -> ChallengeNode:
         ChallengeNode: The node selected for evaluation.
     """
 
-    scores = [(node.value + 1e-3) for node in self.tree.nodes]
-    total_score = sum(scores)
-    # check if there are any nodes with value 0 (unexplored)
-    zero_value_nodes = [node for node in self.tree.nodes if node.value == 0]
-    if zero_value_nodes and len(zero_value_nodes) > 20:
+    exploration_probability = self.phase_params.exploration_probability
+
+    # scores are cached on the tree and only recomputed after it changes
+    selection = self.tree.get_selection_weights()
+    nodes = selection.nodes
+    # nodes with value 0 (unexplored)
+    zero_value_nodes = selection.zero_value_nodes
+
+    if random.random() < exploration_probability:
+        node = random.choice(nodes)
+        logger.debug("Random exploration: selected node {} ({}, {})", node.id, node.concepts, node.difficulty)
+    elif len(zero_value_nodes) > 20:
         # if there are unexplored nodes, prioritize them exclusively
         # equal probability among all zero-value nodes
-        probabilities = []
-        for node in self.tree.nodes:
-            if node.value == 0:
-                probabilities.append(1.0 / len(zero_value_nodes))
-            else:
-                probabilities.append(0.0)
-        logger.debug(f"Prioritizing {len(zero_value_nodes)} unexplored nodes (value=0)")
-    else:
-        probabilities = [(score) / total_score for score in scores]
-
-    if random.random() < self.phase_params.exploration_probability:
-        node = random.choice(self.tree.nodes)
-        logger.debug(f"Random exploration: selected node {node.id} ({node.concepts}, {node.difficulty})")
+        logger.debug("Prioritizing {} unexplored nodes (value=0)", len(zero_value_nodes))
+        node = random.choice(zero_value_nodes)
+        logger.debug("Probability-based selection: selected node {} ({}, {})", node.id, node.concepts, node.difficulty)
     else:
-        node = random.choices(self.tree.nodes, weights=probabilities)[0]
-        logger.debug(f"Probability-based selection: selected node {node.id} ({node.concepts}, {node.difficulty})")
+        # cached prefix sum, random.choices only has to bisect it
+        node = random.choices(nodes, cum_weights=selection.cum_weights)[0]
+        logger.debug("Probability-based selection: selected node {} ({}, {})", node.id, node.concepts, node.difficulty)
 
     # once a node is selected, traverse it until a leaf node is reached
-    while node.children:
-        # random probability of selecting a child node
-        if random.random() < self.phase_params.exploration_probability:
-            node = random.choice(node.children)
-            logger.debug(f"Random child exploration: selected {node.id} ({node.concepts}, {node.difficulty})")
-        # otherwise, select the best child node based on UCB1
-        else:
-            node = max(node.children, key=lambda n: n.ucb1())
-            logger.debug(f"UCB1 child selection: selected {node.id} ({node.concepts}, {node.difficulty})")
-
-    return node
+    return self.descend_to_leaf(node)
 
 
 @phase_registry.register_phase_method("phase_1", "evaluate_node")
@@ -76,7 +77,7 @@ async def evaluate_node(
     Returns:
         Dict: The evaluation results
     """
-    logger.debug(f"Running challenge for node {node.id} ({node.concepts}, {node.difficulty})")
+    logger.debug("Running challenge for node {} ({}, {})", node.id, node.concepts, node.difficulty)
 
     # Call the environment service asynchronously
     evaluation_results = await self.environment.run_challenge(
@@ -89,7 +90,7 @@ async def evaluate_node(
 
     success = evaluation_results.get("success", False)
     data_trail_length = len(evaluation_results.get("data_trail", []))
-    logger.debug(f"Challenge completed for node {node.id}: success={success}, attempts={data_trail_length}")
+    logger.debug("Challenge completed for node {}: success={}, attempts={}", node.id, success, data_trail_length)
 
     return evaluation_results
 
@@ -113,26 +114,22 @@ def calculate_node_value(
     Returns:
         float: The normalized score between 0 and 1.
     """
-    difficulty_weights = {
-        "very easy": 1,
-        "easy": 1.5,
-        "medium": 2,
-        "hard": 2.5,
-        "very hard": 3,
-    }
-    base_score = (10 if results.get("success") else 0) * difficulty_weights.get(difficulty_level, 1)
+    base_score = (10 if results.get("success") else 0) * DIFFICULTY_WEIGHTS.get(difficulty_level, 1)
 
     # Extract metrics from data trail
     data_trail = results.get("data_trail", [])
 
-    # Sum up all test results across all attempts
-    num_passed = sum(dt.get("tests_passed_num", 0) for dt in data_trail)
-    num_failed = sum(dt.get("tests_failed_num", 0) for dt in data_trail)
-    num_errors = sum(dt.get("tests_errored_num", 0) for dt in data_trail)
+    # Sum up all test results across all attempts and find the first successful attempt in one pass
+    num_passed = num_failed = num_errors = 0
+    first_success = -1
+    for i, dt in enumerate(data_trail):
+        num_passed += dt.get("tests_passed_num", 0)
+        num_failed += dt.get("tests_failed_num", 0)
+        num_errors += dt.get("tests_errored_num", 0)
+        if first_success < 0 and dt.get("success"):
+            first_success = i
 
-    # Count successful attempts
-    successful_attempts = [dt for dt in data_trail if dt.get("success")]
-    attempts_till_success = len(data_trail) if not successful_attempts else data_trail.index(successful_attempts[0]) + 1
+    attempts_till_success = len(data_trail) if first_success < 0 else first_success + 1
 
     # Check if fixed by problem fixer (last attempt was successful and marked as fixed)
     fixed_by_problem_fixer = False
@@ -149,12 +146,15 @@ def calculate_node_value(
     raw_score = max(raw_score, 0)  # Ensure the score is not negative
 
     # Normalize the score between 0 and 1
-    max_base_score = 10 * max(difficulty_weights.values())
-    max_raw_score = max_base_score + self.scoring_params.max_num_passed
+    max_raw_score = MAX_BASE_SCORE + self.scoring_params.max_num_passed
     normalized_score = raw_score / max_raw_score
 
     logger.debug(
-        f"Score calculation: base={base_score:.1f}, passed={num_passed}, penalties={failure_penalty + error_penalty + attempt_penalty + fixer_penalty:.1f}, normalized={normalized_score:.3f}"
+        "Score calculation: base={:.1f}, passed={}, penalties={:.1f}, normalized={:.3f}",
+        base_score,
+        num_passed,
+        failure_penalty + error_penalty + attempt_penalty + fixer_penalty,
+        normalized_score,
     )
 
     return normalized_score
@@ -176,22 +176,29 @@ def backpropagate_node_value(
     gamma = self.search_params.discount_factor
     learning_rate = self.search_params.learning_rate
 
-    # update the node value
-    old_value = node.value
-    node.update_node_score(learning_rate, reward)
-    logger.debug(f"Updated node {node.id} value: {old_value:.3f} -> {node.value:.3f} (reward: {reward:.3f})")
+    # walk up the tree with an explicit stack; parents are pushed in reverse so they are
+    # updated in the same depth-first order as a recursive walk, once per path to the root
+    stack = [(node, reward)]
+    updates = 0
+    while stack:
+        current_node, current_reward = stack.pop()
+
+        # update the node value
+        current_node.update_node_score(learning_rate, current_reward)
+        updates += 1
 
-    # if the node has no parents, return
-    if not node.parents:
-        return
+        # backpropagate the discounted reward to the parents; root nodes have no parents (None)
+        if current_node.parents:
+            discounted_reward = current_reward * gamma
+            stack.extend((parent_node, discounted_reward) for parent_node in reversed(current_node.parents))
 
-    # backpropagate the reward up the tree
-    for parent_node in node.parents:
-        discounted_reward = reward * gamma
-        self.backpropagate_node_value(
-            parent_node,
-            discounted_reward,
-        )
+    logger.debug(
+        "Backpropagated reward {:.3f} from node {}: value now {:.3f}, {} node updates",
+        reward,
+        node.id,
+        node.value,
+        updates,
+    )
 
 
 @phase_registry.register_phase_method("phase_1", "expand_node")
@@ -206,29 +213,29 @@ async def expand_node(
         node (ChallengeNode): The node to attempt expansion on.
     """
 
+    performance_threshold = self.phase_params.performance_threshold
+    max_depth = self.phase_params.max_depth
+    exploration_probability = self.phase_params.exploration_probability
+
     current_node = node
     expansion_count = 0
 
-    while (
-        current_node.value >= self.phase_params.performance_threshold
-        and current_node.depth <= self.phase_params.max_depth
-    ):
+    while current_node.value >= performance_threshold and current_node.depth <= max_depth:
         # `BasePhase.expand_node` has already added *current_node.id* to
         # `self.nodes_being_expanded` before delegating here. Treating the
         # current node as a conflict would therefore stop all expansion.
         # We only want to guard against *other* nodes/ancestors that are
         # currently being expanded elsewhere.
-        ancestors = set(current_node.get_node_ancestors_ids())
-        if any(nid in self.nodes_being_expanded for nid in ancestors):
-            logger.debug(f"Stopping expansion of node {current_node.id} - ancestor being expanded elsewhere")
+        if not current_node.get_node_ancestors_ids_cached().isdisjoint(self.nodes_being_expanded):
+            logger.debug("Stopping expansion of node {} - ancestor being expanded elsewhere", current_node.id)
             break
 
-        if random.random() < self.phase_params.exploration_probability:
-            logger.debug(f"Expanding node {current_node.id} by adding new concepts")
+        if random.random() < exploration_probability:
+            logger.debug("Expanding node {} by adding new concepts", current_node.id)
             second_node = await self.select_node()
             expanded_node = self.tree.add_node([current_node, second_node])
         else:
-            logger.debug(f"Expanding node {current_node.id} by increasing difficulty")
+            logger.debug("Expanding node {} by increasing difficulty", current_node.id)
             expanded_node = self.tree.add_node([current_node])
 
         expansion_count += 1
@@ -243,27 +250,30 @@ async def expand_node(
             # check if the node still exists in the tree after evaluation
             # if it was removed due to empty data trail, don't continue processing
             if expanded_node not in self.tree.nodes:
-                logger.debug(f"Node {expanded_node.id} was removed during evaluation, stopping expansion")
+                logger.debug("Node {} was removed during evaluation, stopping expansion", expanded_node.id)
                 break
 
             # update current_node to continue expansion from the new node
             current_node = expanded_node
         else:
             logger.debug(
-                f"Reusing existing node {expanded_node.id} ({expanded_node.concepts}, {expanded_node.difficulty})"
+                "Reusing existing node {} ({}, {})", expanded_node.id, expanded_node.concepts, expanded_node.difficulty
             )
             # for existing nodes, we can choose to continue expansion or stop
             # if the existing node has a good value, continue from it
-            if expanded_node.value >= self.phase_params.performance_threshold:
+            if expanded_node.value >= performance_threshold:
                 current_node = expanded_node
             else:
                 # stop expansion if the existing node doesn't meet threshold
                 logger.debug(
-                    f"Stopping expansion - existing node {expanded_node.id} value {expanded_node.value:.3f} below threshold {self.phase_params.performance_threshold}"
+                    "Stopping expansion - existing node {} value {:.3f} below threshold {}",
+                    expanded_node.id,
+                    expanded_node.value,
+                    performance_threshold,
                 )
                 break
 
     if expansion_count > 0:
-        logger.debug(f"Expansion completed for node {node.id}: {expansion_count} nodes processed")
+        logger.debug("Expansion completed for node {}: {} nodes processed", node.id, expansion_count)
     else:
-        logger.debug(f"No expansion performed for node {node.id} (value: {node.value:.3f}, depth: {node.depth})")
+        logger.debug("No expansion performed for node {} (value: {:.3f}, depth: {})", node.id, node.value, node.depth)
@@ -22,10 +22,13 @@ async def initialize_phase(phase: "BasePhase") -> None:
     Returns:
         None
     """
+    node_selection_threshold = phase.phase_params.node_selection_threshold
+    variations_per_concept = phase.phase_params.variations_per_concept
+
     for node in phase.tree.nodes:
-        if node.phase == 2 and node.value > phase.phase_params.node_selection_threshold:
+        if node.phase == 2 and node.value > node_selection_threshold:
             node.phase_2_value = node.value
-            for i in range(phase.phase_params.variations_per_concept):
+            for i in range(variations_per_concept):
                 phase.tree.add_node(
                     parent_nodes=[node],
                     concepts=node.concepts,
@@ -49,34 +52,25 @@ async def select_node(self: "BasePhase") -> ChallengeNode:
         ChallengeNode: The node selected for evaluation.
     """
 
-    nodes_to_select = [node for node in self.tree.nodes if node.phase == 3]
-    scores = [(node.value + 1e-3) for node in nodes_to_select]
+    exploration_probability = self.phase_params.exploration_probability
 
-    total_score = sum(scores)
-    if total_score == 0:
-        # if all scores are zero, select randomly
-        probabilities = [1 / len(scores)] * len(scores)
-    else:
-        probabilities = [(score) / total_score for score in scores]
+    # phase 3 nodes and their scores are cached on the tree and only recomputed after it changes
+    selection = self.tree.get_selection_weights(phase=3)
+    nodes_to_select = selection.nodes
 
-    if random.random() < self.phase_params.exploration_probability:
+    if random.random() < exploration_probability:
+        node = random.choice(nodes_to_select)
+        logger.debug("Random exploration: selected node {} ({}, {})", node.id, node.concepts, node.difficulty)
+    elif selection.total == 0:
+        # if all scores are zero, select randomly
         node = random.choice(nodes_to_select)
-        logger.debug(f"Random exploration: selected node {node.id} ({node.concepts}, {node.difficulty})")
+        logger.debug("Probability-based selection: selected node {} ({}, {})", node.id, node.concepts, node.difficulty)
     else:
-        node = random.choices(nodes_to_select, weights=probabilities)[0]
-        logger.debug(f"Probability-based selection: selected node {node.id} ({node.concepts}, {node.difficulty})")
+        # cached prefix sum, random.choices only has to bisect it
+        node = random.choices(nodes_to_select, cum_weights=selection.cum_weights)[0]
+        logger.debug("Probability-based selection: selected node {} ({}, {})", node.id, node.concepts, node.difficulty)
     # once a node is selected, traverse it until a leaf node is reached
-    while node.children:
-        # random probability of selecting a child node
-        if random.random() < self.phase_params.exploration_probability:
-            node = random.choice(node.children)
-            logger.debug(f"Random child exploration: selected {node.id} ({node.concepts}, {node.difficulty})")
-        # otherwise, select the best child node based on UCB1
-        else:
-            node = max(node.children, key=lambda n: n.ucb1())
-            logger.debug(f"UCB1 child selection: selected {node.id} ({node.concepts}, {node.difficulty})")
-
-    return node
+    return self.descend_to_leaf(node)
 
 
 @phase_registry.register_phase_method("phase_3", "evaluate_node")
@@ -94,14 +88,14 @@ async def evaluate_node(
     Returns:
         Dict: The evaluation results
     """
-    logger.debug(f"Running challenge for node {node.id} ({node.concepts}, {node.difficulty})")
+    logger.debug("Running challenge for node {} ({}, {})", node.id, node.concepts, node.difficulty)
 
-    previous_problems = []
-    for parent_node in node.parents:
-        for child_node in parent_node.children:
-            previous_problems.append(
-                child_node.run_results[-1].get("problem_statement", "") if child_node.run_results else ""
-            )
+    # latest problem statement of every sibling, so the environment can avoid generating duplicates
+    previous_problems = [
+        child_node.run_results[-1].get("problem_statement", "") if child_node.run_results else ""
+        for parent_node in node.parents
+        for child_node in parent_node.children
+    ]
 
     # Call the environment service asynchronously
     evaluation_results = await self.environment.run_challenge(
@@ -115,7 +109,7 @@ async def evaluate_node(
 
     success = evaluation_results.get("success", False)
     data_trail_length = len(evaluation_results.get("data_trail", []))
-    logger.debug(f"Challenge completed for node {node.id}: success={success}, attempts={data_trail_length}")
+    logger.debug("Challenge completed for node {}: success={}, attempts={}", node.id, success, data_trail_length)
 
     return evaluation_results
 
@@ -144,17 +138,18 @@ def calculate_node_value(
     try:
         data_trail = results.get("data_trail", [])
 
-        # Calculate total tests across all attempts
+        # Calculate total tests across all attempts and find the first successful attempt in one pass
         total_tests = 0
         success_count = 0
+        first_success = -1
 
-        for dt in data_trail:
-            attempt_tests = (
-                dt.get("tests_passed_num", 0) + dt.get("tests_failed_num", 0) + dt.get("tests_errored_num", 0)
-            )
-            total_tests += attempt_tests
+        for i, dt in enumerate(data_trail):
+            tests_passed = dt.get("tests_passed_num", 0)
+            total_tests += tests_passed + dt.get("tests_failed_num", 0) + dt.get("tests_errored_num", 0)
             if dt.get("success"):
-                success_count += dt.get("tests_passed_num", 0)
+                success_count += tests_passed
+                if first_success < 0:
+                    first_success = i
 
         # Invert success rate - higher means more challenging
         if total_tests > 0:
@@ -164,8 +159,7 @@ def calculate_node_value(
         challenge_from_success = 1 - success_rate
 
         # More attempts means more challenging
-        successful_attempts = [dt for dt in data_trail if dt.get("success")]
-        attempts = len(data_trail) if not successful_attempts else data_trail.index(successful_attempts[0]) + 1
+        attempts = len(data_trail) if first_success < 0 else first_success + 1
         attempt_factor = min(attempts / 3, 1.0)
 
         # Needing fixes means more challenging
@@ -202,22 +196,29 @@ def backpropagate_node_value(
     gamma = self.search_params.discount_factor
     learning_rate = self.search_params.learning_rate
 
-    # update the node value
-    old_value = node.value
-    node.update_node_score(learning_rate, reward)
-    logger.debug(f"Updated node {node.id} value: {old_value:.3f} -> {node.value:.3f} (reward: {reward:.3f})")
-
-    # if the node has no parents, return
-    if not node.parents:
-        return
-
-    # backpropagate the reward up the tree
-    for parent_node in node.parents:
-        discounted_reward = reward * gamma
-        self.backpropagate_node_value(
-            parent_node,
-            discounted_reward,
-        )
+    # walk up the tree with an explicit stack; parents are pushed in reverse so they are
+    # updated in the same depth-first order as a recursive walk, once per path to the root
+    stack = [(node, reward)]
+    updates = 0
+    while stack:
+        current_node, current_reward = stack.pop()
+
+        # update the node value
+        current_node.update_node_score(learning_rate, current_reward)
+        updates += 1
+
+        # backpropagate the discounted reward to the parents; root nodes have no parents (None)
+        if current_node.parents:
+            discounted_reward = current_reward * gamma
+            stack.extend((parent_node, discounted_reward) for parent_node in reversed(current_node.parents))
+
+    logger.debug(
+        "Backpropagated reward {:.3f} from node {}: value now {:.3f}, {} node updates",
+        reward,
+        node.id,
+        node.value,
+        updates,
+    )
 
 
 @phase_registry.register_phase_method("phase_3", "expand_node")
@@ -1,9 +1,14 @@
 import importlib
+import os
+import sys
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set
 
 from loguru import logger
 
+# directory containing the built-in phase modules
+PHASES_DIRECTORY = os.fspath(Path(__file__).parent)
+
 
 class PhaseRegistry:
     """
@@ -16,7 +21,9 @@ class PhaseRegistry:
     def __init__(self) -> None:
         """Initialize the registry with empty phase collections."""
         self.phases: Dict[str, Dict[str, Callable]] = {}
-        self._loaded_modules: List[str] = []
+        self._loaded_modules: Set[str] = set()
+        # phases directory -> discovered phase module names; the files do not change at runtime
+        self._discovery_cache: Dict[str, List[str]] = {}
 
     def load_phase_modules(
         self,
@@ -35,26 +42,70 @@ class PhaseRegistry:
         loaded_phases = []
 
         for phase_module in discovered_phases:
-            if phase_module not in self._loaded_modules:
-                try:
-                    # import the module to trigger phase registration
-                    importlib.import_module(f"..{phase_module}", package=__name__)
-                    loaded_phases.append(phase_module)
-                    self._loaded_modules.append(phase_module)
-                    logger.debug(f"Loaded phase module: {phase_module}")
-                except ImportError as e:
-                    logger.error(f"Failed to load phase module {phase_module}: {e}")
+            if phase_module not in self._loaded_modules and self._import_phase_module(phase_module):
+                loaded_phases.append(phase_module)
 
         logger.info(f"Successfully loaded {len(loaded_phases)} phase modules")
         logger.info(f"Available phases: {self.phases}")
         return loaded_phases
 
+    def load_phase(
+        self,
+        phase_name: str,
+        phases_directory: Optional[str] = None,
+    ) -> bool:
+        """
+        Import the module of a single phase on first use, if it is not registered yet.
+        Only works for phases whose module is named after the phase (e.g. phase_1.py registers 'phase_1').
+
+        Args:
+            phase_name: Name of the phase to load
+            phases_directory: Optional custom directory for phase modules
+
+        Returns:
+            True if the phase is registered afterwards, False otherwise
+        """
+        if phase_name in self.phases:
+            return True
+
+        if phase_name not in self._loaded_modules and phase_name in self.discover_phases(phases_directory):
+            self._import_phase_module(phase_name)
+
+        return phase_name in self.phases
+
+    def _import_phase_module(
+        self,
+        phase_module: str,
+    ) -> bool:
+        """
+        Import a phase module to trigger its phase registration.
+        Modules that are already imported are taken from sys.modules without going through the import system.
+
+        Args:
+            phase_module: Name of the phase module
+
+        Returns:
+            True if the module was imported, False otherwise
+        """
+        module_name = f"{__package__}.{phase_module}"
+        if module_name not in sys.modules:
+            try:
+                importlib.import_module(module_name)
+            except ImportError as e:
+                logger.error(f"Failed to load phase module {phase_module}: {e}")
+                return False
+
+        self._loaded_modules.add(phase_module)
+        logger.debug(f"Loaded phase module: {phase_module}")
+        return True
+
     def discover_phases(
         self,
         phases_directory: Optional[str] = None,
     ) -> List[str]:
         """
         Discover all phase modules in the phases directory.
+        The directory is only scanned once; later calls return the cached result.
 
         Args:
             phases_directory: Optional custom directory for phase modules.
@@ -63,24 +114,26 @@ class PhaseRegistry:
         Returns:
             List of discovered phase module names
         """
-        if phases_directory is None:
-            # default to the directory containing this file
-            phases_dir = Path(__file__).parent
-        else:
-            phases_dir = Path(phases_directory)
-
-        discovered_phases = []
-
-        # look for phase_*.py files
-        for file_path in phases_dir.glob("phase_*.py"):
-            if "phase_registry.py" in file_path.name:
-                continue
-            if file_path.is_file() and not file_path.name.startswith("__"):
-                module_name = file_path.stem
-                discovered_phases.append(module_name)
-
-        logger.info(f"Discovered phases: {discovered_phases}")
-        return discovered_phases
+        # default to the directory containing this file
+        phases_dir = PHASES_DIRECTORY if phases_directory is None else os.fspath(phases_directory)
+
+        discovered_phases = self._discovery_cache.get(phases_dir)
+        if discovered_phases is None:
+            discovered_phases = []
+
+            # look for phase_*.py files
+            with os.scandir(phases_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.startswith("phase_") or not name.endswith(".py") or name == "phase_registry.py":
+                        continue
+                    if entry.is_file():
+                        discovered_phases.append(name[:-3])
+
+            self._discovery_cache[phases_dir] = discovered_phases
+            logger.info(f"Discovered phases: {discovered_phases}")
+
+        return list(discovered_phases)
 
     def register_phase_method(
         self,
@@ -8,6 +8,7 @@ from .responses import (
     TaskStatusResponse,
     TreeDataResponse,
 )
+from .serialization import serialize_phases, serialize_task
 
 __all__ = [
     # Domain models
@@ -26,4 +27,7 @@ __all__ = [
     "TreeDataResponse",
     "HealthResponse",
     "ErrorResponse",
+    # Serialization helpers
+    "serialize_phases",
+    "serialize_task",
 ]
@@ -0,0 +1,53 @@
+from typing import Any, Dict
+
+from .domain import PhaseStatus, Task
+
+
+def serialize_phases(
+    phases: Dict[str, PhaseStatus],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Serialize phase statuses for a response body.
+
+    Datetimes are passed through as-is; orjson encodes them natively as RFC 3339 strings.
+
+    Args:
+        phases: Phase statuses keyed by phase name
+
+    Returns:
+        Dictionary of phase status fields keyed by phase name
+    """
+    return {
+        phase_name: {
+            "status": phase.status,
+            "created_at": phase.created_at,
+            "started_at": phase.started_at,
+            "completed_at": phase.completed_at,
+            "cancelled_at": phase.cancelled_at,
+            "error": phase.error,
+            "path": phase.path,
+        }
+        for phase_name, phase in phases.items()
+    }
+
+
+def serialize_task(
+    task: Task,
+    message: str,
+) -> Dict[str, Any]:
+    """
+    Serialize a task into a TaskResponse body.
+
+    Args:
+        task: The task to serialize
+        message: Response message
+
+    Returns:
+        Dictionary matching the TaskResponse schema
+    """
+    return {
+        "task_id": task.task_id,
+        "session_id": task.session_id,
+        "message": message,
+        "phases": serialize_phases(task.phases),
+    }
@@ -6,7 +6,12 @@ from .base import BaseRepository
 
 
 class SessionRepository(BaseRepository[Session]):
-    """In-memory session repository with thread-safe operations."""
+    """
+    In-memory session repository with thread-safe operations.
+
+    Reads never await, so they run atomically on the event loop and skip the lock; only
+    mutations take it.
+    """
 
     def __init__(self):
         self._sessions: Dict[str, Session] = {}
@@ -17,8 +22,7 @@ class SessionRepository(BaseRepository[Session]):
         session_id: str,
     ) -> Optional[Session]:
         """Get a session by ID."""
-        async with self._lock:
-            return self._sessions.get(session_id)
+        return self._sessions.get(session_id)
 
     async def save(
         self,
@@ -44,22 +48,19 @@ class SessionRepository(BaseRepository[Session]):
         session_id: str,
     ) -> bool:
         """Check if a session exists."""
-        async with self._lock:
-            return session_id in self._sessions
+        return session_id in self._sessions
 
     async def get_all(
         self,
     ) -> Dict[str, Session]:
         """Get all sessions."""
-        async with self._lock:
-            return dict(self._sessions)
+        return dict(self._sessions)
 
     async def get_active_sessions(
         self,
     ) -> Dict[str, Session]:
         """Get all active sessions."""
-        async with self._lock:
-            return {session_id: session for session_id, session in self._sessions.items() if session.status == "active"}
+        return {session_id: session for session_id, session in self._sessions.items() if session.status == "active"}
 
     async def update_session_status(
         self,
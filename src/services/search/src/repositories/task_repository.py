@@ -1,60 +1,103 @@
 import asyncio
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 
 from ..models.domain import Task, TaskStatus
 from .base import BaseRepository
 
+# statuses after which a task is eligible for cleanup
+COMPLETED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
 
 class TaskRepository(BaseRepository[Task]):
-    """In-memory task repository with thread-safe operations."""
+    """
+    In-memory task repository with thread-safe operations.
+
+    Tasks are indexed by session and by status so filtered queries only touch matching tasks.
+    Status changes made directly on a Task are picked up by the status index on the next save.
+
+    Reads never await, so they run atomically on the event loop and skip the lock; only
+    mutations take it.
+    """
 
     def __init__(self):
         self._tasks: Dict[str, Task] = {}
         self._lock = asyncio.Lock()
+        # secondary indexes: session id -> task ids, status -> task ids
+        self._by_session: Dict[str, Set[str]] = defaultdict(set)
+        self._by_status: Dict[TaskStatus, Set[str]] = defaultdict(set)
+        # task id -> (session id, status) the task is currently indexed under
+        self._indexed: Dict[str, Tuple[str, TaskStatus]] = {}
+
+    def _index(self, task: Task) -> None:
+        """Point the secondary indexes at the task's current session and status. Caller holds the lock."""
+        key = (task.session_id, task.status)
+        previous = self._indexed.get(task.task_id)
+        if previous == key:
+            return
+        if previous is not None:
+            self._unindex(task.task_id)
+        self._by_session[task.session_id].add(task.task_id)
+        self._by_status[task.status].add(task.task_id)
+        self._indexed[task.task_id] = key
+
+    def _unindex(self, task_id: str) -> None:
+        """Remove a task from the secondary indexes. Caller holds the lock."""
+        session_id, status = self._indexed.pop(task_id)
+        self._discard(self._by_session, session_id, task_id)
+        self._discard(self._by_status, status, task_id)
+
+    @staticmethod
+    def _discard(index: Dict, key, task_id: str) -> None:
+        """Remove a task id from an index bucket, dropping the bucket once it is empty."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(task_id)
+            if not bucket:
+                del index[key]
 
     async def get(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
-        async with self._lock:
-            return self._tasks.get(task_id)
+        return self._tasks.get(task_id)
 
     async def save(self, task: Task) -> None:
         """Save or update a task."""
         async with self._lock:
             self._tasks[task.task_id] = task
+            self._index(task)
 
     async def delete(self, task_id: str) -> bool:
         """Delete a task by ID."""
         async with self._lock:
             if task_id in self._tasks:
                 del self._tasks[task_id]
+                self._unindex(task_id)
                 return True
             return False
 
     async def exists(self, task_id: str) -> bool:
         """Check if a task exists."""
-        async with self._lock:
-            return task_id in self._tasks
+        return task_id in self._tasks
 
     async def get_all(self) -> Dict[str, Task]:
         """Get all tasks."""
-        async with self._lock:
-            return dict(self._tasks)
+        return dict(self._tasks)
 
     async def get_by_session(
         self,
         session_id: str,
     ) -> List[Task]:
         """Get all tasks for a specific session."""
-        async with self._lock:
-            return [task for task in self._tasks.values() if task.session_id == session_id]
+        return [self._tasks[task_id] for task_id in self._by_session.get(session_id, ())]
 
     async def get_by_status(
         self,
         status: TaskStatus,
     ) -> List[Task]:
         """Get all tasks with a specific status."""
-        async with self._lock:
-            return [task for task in self._tasks.values() if task.status == status]
+        # re-check the live status, a task may have been changed in place since it was last saved
+        tasks = (self._tasks[task_id] for task_id in self._by_status.get(status, ()))
+        return [task for task in tasks if task.status == status]
 
     async def get_running_tasks(self) -> List[Task]:
         """Get all currently running tasks."""
@@ -73,7 +116,9 @@ class TaskRepository(BaseRepository[Task]):
         """Update task status."""
         async with self._lock:
             if task_id in self._tasks:
-                self._tasks[task_id].update_status(status, error)
+                task = self._tasks[task_id]
+                task.update_status(status, error)
+                self._index(task)
                 return True
             return False
 
@@ -84,9 +129,11 @@ class TaskRepository(BaseRepository[Task]):
         """Cancel all running tasks for a session and return their IDs."""
         cancelled_task_ids = []
         async with self._lock:
-            for task in self._tasks.values():
-                if task.session_id == session_id and task.status == TaskStatus.RUNNING:
+            for task_id in list(self._by_session.get(session_id, ())):
+                task = self._tasks[task_id]
+                if task.status == TaskStatus.RUNNING:
                     task.update_status(TaskStatus.CANCELLED)
+                    self._index(task)
                     if task.asyncio_task and not task.asyncio_task.done():
                         task.asyncio_task.cancel()
                     cancelled_task_ids.append(task.task_id)
@@ -104,12 +151,15 @@ class TaskRepository(BaseRepository[Task]):
 
         async with self._lock:
             tasks_to_remove = []
-            for task_id, task in self._tasks.items():
-                if task.is_completed() and task.completed_at and task.completed_at < cutoff_time:
-                    tasks_to_remove.append(task_id)
+            for status in COMPLETED_STATUSES:
+                for task_id in self._by_status.get(status, ()):
+                    task = self._tasks[task_id]
+                    if task.is_completed() and task.completed_at and task.completed_at < cutoff_time:
+                        tasks_to_remove.append(task_id)
 
             for task_id in tasks_to_remove:
                 del self._tasks[task_id]
+                self._unindex(task_id)
                 removed_count += 1
 
         return removed_count
@@ -118,3 +168,6 @@ class TaskRepository(BaseRepository[Task]):
         """Clear all tasks (useful for testing)."""
         async with self._lock:
             self._tasks.clear()
+            self._by_session.clear()
+            self._by_status.clear()
+            self._indexed.clear()
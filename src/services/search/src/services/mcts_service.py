@@ -20,12 +20,12 @@ class MCTSService:
     ):
         self.settings = settings
 
-        # automatically load all phase modules
-        phase_registry.load_phase_modules()
+        # only index the phase modules on disk; each one is imported the first time a task runs it
+        self.available_phase_modules = phase_registry.discover_phases()
 
-        # get all available phases
+        # registered phases, filled in as phase modules are loaded
         self.phases = phase_registry.list_phases()
-        logger.info(f"Available phases: {self.phases}")
+        logger.info(f"Available phase modules: {self.available_phase_modules}")
 
     def _build_phase_config(
         self,
@@ -76,8 +76,11 @@ class MCTSService:
             tree: Tree instance
             task: Task instance
         """
-        if phase_name not in self.phases:
-            raise MCTSExecutionException(f"Phase '{phase_name}' not found. Available: {self.phases}")
+        if not phase_registry.load_phase(phase_name):
+            # the phase may be registered by a module named differently, so fall back to loading them all
+            phase_registry.load_phase_modules()
+            if phase_name not in self.phases:
+                raise MCTSExecutionException(f"Phase '{phase_name}' not found. Available: {self.phases}")
 
         try:
             logger.info(f"Starting {phase_name} for task {task.task_id}")
@@ -100,25 +103,28 @@ class MCTSService:
             # get environment
             environment = EnvironmentClient(config["environment"])
 
-            # Lazy import to avoid circular import
-            from ..mcts.utils import create_phase
-
-            # Create and run phase
-            phase = create_phase(
-                phase_name=phase_name,
-                tree=tree,
-                environment=environment,
-                config=config,
-            )
-
-            # check for resume flag
-            resume_iteration = task.metadata.get("resume_iteration", None)
-            resume_phase = task.metadata.get("resume_phase", None)
-            if resume_iteration is not None and phase_name == resume_phase:
-                phase.set_resume_state(iteration=resume_iteration)
-                logger.info(f"Resuming {phase_name} from iteration {resume_iteration}")
-
-            await phase.run()
+            try:
+                # Lazy import to avoid circular import
+                from ..mcts.utils import create_phase
+
+                # Create and run phase
+                phase = create_phase(
+                    phase_name=phase_name,
+                    tree=tree,
+                    environment=environment,
+                    config=config,
+                )
+
+                # check for resume flag
+                resume_iteration = task.metadata.get("resume_iteration", None)
+                resume_phase = task.metadata.get("resume_phase", None)
+                if resume_iteration is not None and phase_name == resume_phase:
+                    phase.set_resume_state(iteration=resume_iteration)
+                    logger.info(f"Resuming {phase_name} from iteration {resume_iteration}")
+
+                await phase.run()
+            finally:
+                await environment.aclose()
 
             # Update phase status to completed
             if phase_status:
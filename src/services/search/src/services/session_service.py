@@ -1,5 +1,8 @@
-from typing import Dict
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 
+import orjson
 from loguru import logger
 
 from ..core.config import Settings
@@ -19,6 +22,11 @@ class SessionService:
     ):
         self.session_repo = session_repo
         self.settings = settings
+        # serialized trees keyed by etag. the tree id and version are part of the etag, so entries never go stale
+        self._tree_json_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._tree_json_cache_size = 64
+        # trees with more nodes than this are serialized in chunks, yielding to the event loop in between
+        self._tree_json_chunk_size = 500
 
     async def create_session(
         self,
@@ -80,3 +88,48 @@ class SessionService:
         """Get tree data for a session."""
         session = await self.get_session(session_id)
         return session.tree.to_dict()
+
+    async def get_session_tree_json(
+        self,
+        session_id: str,
+    ) -> Tuple[str, bytes]:
+        """Get the etag and serialized tree data for a session, reusing the last serialization if unchanged."""
+        session = await self.get_session(session_id)
+        tree = session.tree
+        # the tree id changes when the session's tree is replaced (e.g. on resume), the version on every change
+        etag = f'"{session_id}-{tree.tree_id}-{tree.version}"'
+
+        body = self._tree_json_cache.get(etag)
+        if body is not None:
+            self._tree_json_cache.move_to_end(etag)
+            return etag, body
+
+        body = await self._serialize_tree(tree.to_dict())
+        self._tree_json_cache[etag] = body
+        if len(self._tree_json_cache) > self._tree_json_cache_size:
+            self._tree_json_cache.popitem(last=False)
+        return etag, body
+
+    async def _serialize_tree(
+        self,
+        tree_dict: Dict,
+    ) -> bytes:
+        """Serialize tree data to JSON, encoding large node lists chunk by chunk so other requests are not stalled."""
+        nodes: List[Dict] = tree_dict["nodes"]
+        chunk_size = self._tree_json_chunk_size
+        if len(nodes) <= chunk_size:
+            return orjson.dumps(tree_dict)
+
+        parts = [b'{"nodes":[']
+        for start in range(0, len(nodes), chunk_size):
+            if start:
+                parts.append(b",")
+                await asyncio.sleep(0)
+            # strip the enclosing brackets so the chunks join into a single array
+            parts.append(orjson.dumps(nodes[start : start + chunk_size])[1:-1])
+        parts.append(b'],"concepts":')
+        parts.append(orjson.dumps(tree_dict["concepts"]))
+        parts.append(b',"difficulties":')
+        parts.append(orjson.dumps(tree_dict["difficulties"]))
+        parts.append(b"}")
+        return b"".join(parts)
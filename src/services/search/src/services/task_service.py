@@ -7,6 +7,7 @@ from loguru import logger
 from ..core.config import Settings
 from ..core.exceptions import TaskExecutionException, TaskNotFoundException
 from ..models.domain import PhaseStatus, Task, TaskStatus
+from ..models.serialization import serialize_phases
 from ..repositories.task_repository import TaskRepository
 from ..services.mcts_service import MCTSService
 from ..services.session_service import SessionService
@@ -37,7 +38,7 @@ class TaskService:
         resume_iteration: int = None,
     ) -> Task:
         """Create and start a new MCTS task."""
-        task_id = str(uuid4())
+        task_id = uuid4().hex
 
         # handle resume flag
         if resume:
@@ -146,6 +147,18 @@ class TaskService:
             raise TaskNotFoundException(f"Task {task_id} not found")
         return task
 
+    async def wait_for_task(
+        self,
+        task_id: str,
+        timeout: float,
+    ) -> Task:
+        """Get task by ID, waiting up to `timeout` seconds for it to finish."""
+        task = await self.get_task(task_id)
+        if task.asyncio_task and not task.asyncio_task.done() and timeout > 0:
+            # asyncio.wait neither raises the task's exception nor cancels it on timeout
+            await asyncio.wait({task.asyncio_task}, timeout=timeout)
+        return task
+
     async def get_all_tasks(self) -> Dict[str, Task]:
         """Get all tasks."""
         return await self.task_repo.get_all()
@@ -163,18 +176,7 @@ class TaskService:
                 "task_id": task_id,
                 "session_id": task.session_id,
                 "status": task.status.value,
-                "phases": {
-                    phase_name: {
-                        "status": phase.status,
-                        "created_at": phase.created_at,
-                        "started_at": phase.started_at,
-                        "completed_at": phase.completed_at,
-                        "cancelled_at": phase.cancelled_at,
-                        "error": phase.error,
-                        "path": phase.path,
-                    }
-                    for phase_name, phase in task.phases.items()
-                },
+                "phases": serialize_phases(task.phases),
             }
 
         return status_report
@@ -6,6 +6,12 @@ from loguru import logger
 
 
 class ChallengeNode:
+    # bumped whenever a parent link changes anywhere in a tree, invalidating every cached ancestor set
+    _lineage_version = 0
+    # number of evaluations currently in flight for this node; counted as pessimistic visits by ucb1
+    # so concurrent selections spread out instead of piling onto the same child
+    virtual_loss = 0
+
     def __init__(
         self,
         difficulty: str,
@@ -51,7 +57,10 @@ class ChallengeNode:
         self.run_results = []
         self.value = 0.0  # Initialize the node's value
 
-        logger.debug(f"Created node: Difficulty={difficulty}, Concepts={concepts}, Depth={depth}")
+        # (lineage version, ancestor ids) memo for get_node_ancestors_ids_cached
+        self._ancestor_ids_cache = None
+
+        logger.debug("Created node: Difficulty={}, Concepts={}, Depth={}", difficulty, concepts, depth)
 
     def get_node_ancestors_ids(self) -> list[str]:
         """
@@ -73,6 +82,29 @@ class ChallengeNode:
             current_nodes = next_nodes
         return list(ancestor_ids)
 
+    def get_node_ancestors_ids_cached(self) -> frozenset[str]:
+        """
+        Returns the set of all ancestor node IDs, reusing the last walk while no parent link has changed.
+
+        Returns:
+        - frozenset[str]: The IDs of all ancestor nodes.
+        """
+        cached = getattr(self, "_ancestor_ids_cache", None)
+        if cached is not None and cached[0] == ChallengeNode._lineage_version:
+            return cached[1]
+
+        ancestor_ids = frozenset(self.get_node_ancestors_ids())
+        self._ancestor_ids_cache = (ChallengeNode._lineage_version, ancestor_ids)
+        return ancestor_ids
+
+    def __getstate__(self) -> dict:
+        # the memo is only valid against this process's lineage version and the virtual loss only
+        # against this process's running tasks, so never persist either
+        state = self.__dict__.copy()
+        state.pop("_ancestor_ids_cache", None)
+        state.pop("virtual_loss", None)
+        return state
+
     def update_node_score(self, learning_rate: float, reward: float) -> None:
         """
         Updates the node's value using a TD learning update.
@@ -86,11 +118,12 @@ class ChallengeNode:
         self.visits += 1
         self.value += learning_rate * (reward - self.value)
 
-        logger.debug(f"Updated node value: New value={self.value:.2f}, Reward={reward:.2f}")
+        logger.debug("Updated node value: New value={:.2f}, Reward={:.2f}", self.value, reward)
 
     def ucb1(self, exploration_weight=1.414) -> float:
         """
         Calculates the UCB1 (Upper Confidence Bound 1) value for a node in a tree search.
+        Evaluations still in flight add a visit and a unit penalty on the value each (virtual loss).
 
         Parameters:
             exploration_weight (float): The exploration weight to balance exploration and exploitation.
@@ -100,13 +133,16 @@ class ChallengeNode:
             float: The UCB1 value for the node.
         """
 
-        if self.visits == 0:
+        visits = self.visits + self.virtual_loss
+        if visits == 0:
             return float("inf")
 
-        exploitation = self.value
-        exploration = math.sqrt(
-            math.log(sum([parent.visits for parent in self.parents]) if len(self.parents) > 1 else 1) / self.visits
-        )
+        exploitation = self.value - self.virtual_loss
+        # with a single parent the exploration term is sqrt(log(1) / visits) == 0, so skip the math
+        if len(self.parents) < 2:
+            return exploitation
+
+        exploration = math.sqrt(math.log(sum([parent.visits for parent in self.parents])) / visits)
 
         return exploitation + exploration_weight * exploration
 
@@ -1,8 +1,9 @@
 import html
 import pickle
 from datetime import datetime
-from itertools import combinations
-from typing import Dict, Union
+from itertools import accumulate, combinations
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from uuid import uuid4
 
 from graphviz import Digraph
 from loguru import logger
@@ -10,6 +11,17 @@ from loguru import logger
 from .node import ChallengeNode
 
 
+class SelectionWeights(NamedTuple):
+    """
+    Snapshot of the nodes eligible for selection and their cumulative selection weights.
+    """
+
+    nodes: List[ChallengeNode]
+    cum_weights: List[float]
+    total: float
+    zero_value_nodes: List[ChallengeNode]
+
+
 class Tree:
     """
     A tree data structure for managing challenge nodes in the MCTS algorithm.
@@ -33,6 +45,13 @@ class Tree:
         self.concepts = concepts
         self.difficulties = difficulties
         self.nodes = []
+        # unique per tree instance; together with version it identifies one state of one tree,
+        # since a replacement tree (e.g. on resume) counts its versions from 0 again
+        self.tree_id = uuid4().hex
+        # bumped on every structural or node-level change; readers use it to detect a stale serialization
+        self.version = 0
+        # phase filter -> (tree version, selection weights) for get_selection_weights
+        self._selection_cache: Dict[Optional[int], Tuple[int, SelectionWeights]] = {}
 
         logger.info(f"Initialized tree with {len(concepts)} concepts and {len(difficulties)} difficulty levels")
         logger.debug(f"Concepts: {concepts}")
@@ -65,6 +84,7 @@ class Tree:
             self.add_node(node)
 
         total_combinations = len(self.nodes) - initial_node_count
+        self.mark_modified()
         logger.info(
             f"Tree initialization complete: {len(self.nodes)} total nodes ({initial_node_count} root + {total_combinations} combinations)"
         )
@@ -137,9 +157,41 @@ class Tree:
             parent_node.children.append(new_node)
 
         self.nodes.append(new_node)
+        self.mark_modified()
 
         return new_node
 
+    def get_selection_weights(self, phase: Optional[int] = None) -> SelectionWeights:
+        """
+        Returns the nodes eligible for selection together with the running sum of their selection
+        weights (value + 1e-3), ready to pass as cum_weights to random.choices. The result is cached
+        and only recomputed when the tree version changes, so repeated selections between two
+        evaluations neither rescan the tree nor rebuild the prefix sum.
+
+        Args:
+            phase (Optional[int]): Only include nodes of this phase. Defaults to None (all nodes).
+
+        Returns:
+            SelectionWeights: The eligible nodes, their cumulative weights, the total weight and
+                the nodes that are still unexplored (value 0).
+        """
+        cached = self._selection_cache.get(phase)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+
+        nodes = list(self.nodes) if phase is None else [node for node in self.nodes if node.phase == phase]
+        cum_weights = list(accumulate(node.value + 1e-3 for node in nodes))
+        zero_value_nodes = [node for node in nodes if node.value == 0]
+        selection = SelectionWeights(nodes, cum_weights, cum_weights[-1] if cum_weights else 0.0, zero_value_nodes)
+        self._selection_cache[phase] = (self.version, selection)
+        return selection
+
+    def mark_modified(self) -> None:
+        """
+        Bumps the tree version. Must be called after any change to the tree or its nodes.
+        """
+        self.version += 1
+
     def remove_node(self, node: ChallengeNode) -> None:
         """
         Removes a node from the tree, cleaning up parent and child references.
@@ -165,6 +217,7 @@ class Tree:
             try:
                 child_parents.remove(node)
                 child.parents = child_parents
+                ChallengeNode._lineage_version += 1
             except ValueError:
                 logger.warning(f"Node {node.id} not found in child {child.id} parents")
 
@@ -174,6 +227,7 @@ class Tree:
         except ValueError:
             logger.warning(f"Node {node.id} not found in tree.nodes")
 
+        self.mark_modified()
         logger.info(f"Node {node.id} removed from tree")
 
     def assign_difficulty(self, parent_nodes: list[ChallengeNode]) -> str:
@@ -230,6 +284,15 @@ class Tree:
         Args:
             file_name (str): The name of the file to save the tree visualization to. Defaults to "tree".
         """
+        self.render_visualization(self.build_visualization(), file_name)
+
+    def build_visualization(self) -> Digraph:
+        """
+        Builds the Graphviz graph for the current state of the tree, without rendering it.
+
+        Returns:
+            Digraph: The graph, ready to be passed to `render_visualization`.
+        """
         logger.info(f"Generating tree visualization with {len(self.nodes)} nodes")
 
         dot = Digraph(comment="MCTS Tree")
@@ -320,6 +383,19 @@ class Tree:
         # Add graph title with timestamp
         dot.attr(label=f"MCTS Tree Visualization\nGenerated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
+        logger.debug(f"Visualization stats: {len(self.nodes)} nodes, {edge_count} edges")
+        return dot
+
+    @staticmethod
+    def render_visualization(dot: Digraph, file_name: str = "tree") -> None:
+        """
+        Renders a graph built by `build_visualization` to disk. Only touches the graph, never the tree,
+        so it is safe to run off the event loop while the tree keeps changing.
+
+        Args:
+            dot (Digraph): The graph to render.
+            file_name (str): The name of the file to save the tree visualization to. Defaults to "tree".
+        """
         # Save in multiple formats
         formats_saved = []
         for fmt in ["svg", "pdf"]:
@@ -330,7 +406,6 @@ class Tree:
                 logger.warning(f"Failed to save visualization in {fmt} format: {e}")
 
         logger.info(f"Tree visualization saved as {file_name} in formats: {formats_saved}")
-        logger.debug(f"Visualization stats: {len(self.nodes)} nodes, {edge_count} edges")
 
     def save_tree(self, file_name: str = "tree") -> None:
         """
@@ -363,6 +438,7 @@ class Tree:
         try:
             with open(f"{file_name}.pkl", "rb") as f:
                 self.nodes = pickle.load(f)
+            self.mark_modified()
             logger.info(f"Tree loaded from {file_name}.pkl ({len(self.nodes)} nodes)")
         except FileNotFoundError:
             logger.error(f"Tree file {file_name}.pkl not found")
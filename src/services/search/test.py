@@ -1,6 +1,8 @@
 import asyncio
+from types import SimpleNamespace
 
 from src.environment_client import EnvironmentClient
+from src.mcts import phase_1, phase_2, phase_3
 from src.mcts.utils import create_phase
 from src.mcts.phase_registry import phase_registry
 from src.tree import Tree
@@ -111,7 +113,35 @@ config_phase_3 = {
     },
 }
 
+def check_backpropagation() -> None:
+    """
+    Backpropagating from a node below the roots must reach and update its root ancestors in every phase.
+    Runs offline, without the environment service, and calls the phase strategies directly so no
+    experiment directories are created.
+    """
+    for phase_module, config in (
+        (phase_1, config_phase_1),
+        (phase_2, config_phase_2),
+        (phase_3, config_phase_3),
+    ):
+        check_tree = Tree(concepts=["loops", "functions"], difficulties=["very easy", "easy", "medium"])
+        check_tree.initialize_tree()
+        roots = [node for node in check_tree.nodes if not node.parents]
+        node = check_tree.add_node([max(check_tree.nodes, key=lambda n: n.depth)])
+        assert node.depth >= 1
+
+        # the strategy only reads the search params from the phase
+        phase = SimpleNamespace(search_params=SimpleNamespace(**config["search_params"]))
+        phase_module.backpropagate_node_value(phase, node, 1.0)
+
+        ancestor_ids = set(node.get_node_ancestors_ids())
+        root_ancestors = [root for root in roots if root.id in ancestor_ids]
+        assert node.visits == 1
+        assert root_ancestors and all(root.visits >= 1 and root.value > 0 for root in root_ancestors), phase_module
+
+
 if __name__ == "__main__":
+    check_backpropagation()
 
     async def main() -> None:
         phase_one = create_phase(